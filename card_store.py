@@ -7,37 +7,87 @@ Stores cards as JSON with timestamps. Enables:
   - Prediction accountability: track hit/miss over time
   - Refresh mode: compare new clusters against existing cards
 
-Storage: output/card_history.json (committed to repo by GitHub Actions)
+Storage: output/card_history.jsonl, one run per line (committed to repo by
+GitHub Actions). A pre-existing output/card_history.json is migrated on the
+first save.
 """
 
+import copy
 import json
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
 
-HISTORY_PATH = Path("output/card_history.json")
+HISTORY_PATH = Path("output/card_history.jsonl")
+LEGACY_HISTORY_PATH = Path("output/card_history.json")
 MAX_HISTORY_DAYS = 7  # Keep 7 days of history
+MAX_RUNS = MAX_HISTORY_DAYS * 24  # max runs to keep
+
+
+@lru_cache(maxsize=2048)
+def title_words(title):
+    """Lowercased word set of a title, cached: the same titles are matched
+    against each other repeatedly, here and in refresh."""
+    return frozenset(title.lower().split())
+
+
+# Parsed history keyed by the file's mtime, so one process parses it once
+_history_cache = {"mtime": None, "data": None, "index": None}
+
+
+def _read_runs(path):
+    """Every run stored at path: one JSON object per line, or the legacy
+    single {"runs": [...]} document."""
+    if path == LEGACY_HISTORY_PATH:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if not isinstance(data, dict) or not isinstance(data.get("runs"), list):
+            return []
+        return data["runs"]
+    runs = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                runs.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue  # e.g. a line cut short by an interrupted append
+    return runs
 
 
 def load_history():
-    """Load card history. Returns dict with 'runs' list."""
-    if not HISTORY_PATH.exists():
+    """Load card history. Returns dict with 'runs' list.
+
+    The dict is the cached copy shared by every caller: read it, don't edit it.
+    """
+    path = HISTORY_PATH if HISTORY_PATH.exists() else LEGACY_HISTORY_PATH
+    try:
+        mtime = path.stat().st_mtime_ns
+    except OSError:
         return {"runs": []}
+    if _history_cache["mtime"] == (path, mtime):
+        return _history_cache["data"]
     try:
-        data = json.loads(HISTORY_PATH.read_text(encoding="utf-8"))
-        if not isinstance(data, dict) or "runs" not in data:
-            return {"runs": []}
-        return data
+        runs = _read_runs(path)
     except (json.JSONDecodeError, OSError):
         return {"runs": []}
+    # The log may hold up to 2 * MAX_RUNS lines between compactions
+    data = {"runs": runs[-MAX_RUNS:], "stored": len(runs)}
+    _history_cache["mtime"] = (path, mtime)
+    _history_cache["data"] = data
+    _history_cache["index"] = None
+    return data
 
 
 def get_latest_cards():
-    """Get cards from the most recent run. Returns list of card dicts."""
+    """Get cards from the most recent run. Returns list of card dicts.
+
+    The cards are deep copies: callers rebuild TopicCards from them and edit
+    their lists in place (card_dedup), which must not reach the cached history.
+    """
     history = load_history()
     if not history["runs"]:
         return []
-    return history["runs"][-1].get("cards", [])
+    return copy.deepcopy(history["runs"][-1].get("cards", []))
 
 
 def get_latest_titles():
@@ -46,29 +96,43 @@ def get_latest_titles():
     return set(c.get("title", "") for c in cards if c.get("title"))
 
 
-def save_run(topic_cards, run_time, mode="full"):
-    """Save current run's cards to history."""
-    history = load_history()
+def save_run(topic_cards, run_time, mode="full", card_dicts=None):
+    """Save current run's cards to history.
+
+    Pass card_dicts when the caller already serialized the cards.
+    """
+    if card_dicts is None:
+        card_dicts = [card.to_dict() for card in topic_cards]
 
     run_entry = {
         "timestamp": datetime.now(timezone.utc).isoformat(),
         "mode": mode,
         "runtime_seconds": run_time,
         "card_count": len(topic_cards),
-        "cards": [card.to_dict() for card in topic_cards],
+        "cards": card_dicts,
     }
 
-    history["runs"].append(run_entry)
-
-    # Prune old runs (keep last 7 days worth, ~84 runs at 2hr intervals)
-    cutoff = 7 * 24  # max runs to keep
-    if len(history["runs"]) > cutoff:
-        history["runs"] = history["runs"][-cutoff:]
-
     HISTORY_PATH.parent.mkdir(exist_ok=True)
-    HISTORY_PATH.write_text(
-        json.dumps(history, indent=2, default=str),
-        encoding="utf-8")
+    line = json.dumps(run_entry, ensure_ascii=False, separators=(",", ":"), default=str) + "\n"
+    if HISTORY_PATH.exists() and load_history().get("stored", 0) < 2 * MAX_RUNS:
+        # Append only the new run instead of rewriting the whole history
+        with open(HISTORY_PATH, "a", encoding="utf-8") as f:
+            f.write(line)
+    else:
+        # First save (or migration from card_history.json), or the log has
+        # doubled past the window: rewrite it with only the last MAX_RUNS runs.
+        # The runs are re-read from disk, not taken from the shared cache.
+        source = HISTORY_PATH if HISTORY_PATH.exists() else LEGACY_HISTORY_PATH
+        try:
+            runs = _read_runs(source) if source.exists() else []
+        except (json.JSONDecodeError, OSError):
+            runs = []
+        with open(HISTORY_PATH, "w", encoding="utf-8") as f:
+            f.writelines(
+                json.dumps(run, ensure_ascii=False, separators=(",", ":"), default=str) + "\n"
+                for run in runs[-(MAX_RUNS - 1):])
+            f.write(line)
+    _history_cache["mtime"] = None
 
 
 def classify_story_delta(new_title, new_whats, existing_cards):
@@ -80,48 +144,70 @@ def classify_story_delta(new_title, new_whats, existing_cards):
         return "new"
 
     # Check title similarity against existing cards
-    new_words = set(new_title.lower().split())
+    new_words = title_words(new_title)
+    if not new_words:
+        return "new"
+    new_len = len(new_words)
 
     for card in existing_cards:
-        old_title = card.get("title", "")
-        old_words = set(old_title.lower().split())
-
-        # High overlap = same story
-        if len(new_words) > 0 and len(old_words) > 0:
-            overlap = len(new_words & old_words) / min(len(new_words), len(old_words))
-            if overlap > 0.5:
-                # Same story — check if content changed
-                old_whats = card.get("whats_happening", card.get("what_happened", ""))
-                if new_whats and old_whats:
-                    new_content_words = set(new_whats.lower().split())
-                    old_content_words = set(old_whats.lower().split())
-                    content_overlap = len(new_content_words & old_content_words) / max(len(new_content_words), len(old_content_words), 1)
-                    if content_overlap < 0.6:
-                        return "updated"
-                return "continuing"
+        old_words = title_words(card.get("title", ""))
+        if not old_words or new_words.isdisjoint(old_words):
+            continue
+
+        # High overlap = same story (more than half of the shorter title)
+        if 2 * len(new_words & old_words) > min(new_len, len(old_words)):
+            # Same story — check if content changed
+            old_whats = card.get("whats_happening", card.get("what_happened", ""))
+            if new_whats and old_whats:
+                new_content_words = set(new_whats.lower().split())
+                old_content_words = set(old_whats.lower().split())
+                content_overlap = len(new_content_words & old_content_words) / max(len(new_content_words), len(old_content_words), 1)
+                if content_overlap < 0.6:
+                    return "updated"
+            return "continuing"
 
     return "new"
 
 
-def get_story_streak(title, history=None):
-    """How many consecutive runs has this story appeared?"""
-    if history is None:
-        history = load_history()
+def _run_title_sets(history):
+    """Non-empty title word sets of each run's cards, newest run first.
 
-    streak = 0
+    Built once per loaded history and shared by every streak lookup.
+    """
+    if history is _history_cache["data"] and _history_cache["index"] is not None:
+        return _history_cache["index"]
+    index = []
     for run in reversed(history["runs"]):
-        found = False
-        title_words = set(title.lower().split())
-        for card in run.get("cards", []):
-            card_words = set(card.get("title", "").lower().split())
-            if len(title_words) > 0 and len(card_words) > 0:
-                overlap = len(title_words & card_words) / min(len(title_words), len(card_words))
-                if overlap > 0.5:
-                    found = True
+        words = (title_words(card.get("title", "")) for card in run.get("cards", []))
+        index.append([w for w in words if w])
+    if history is _history_cache["data"]:
+        _history_cache["index"] = index
+    return index
+
+
+def get_story_streaks(titles, history=None):
+    """How many consecutive runs each title has appeared. Returns {title: streak}."""
+    if history is None:
+        history = load_history()
+    index = _run_title_sets(history)
+
+    streaks = {}
+    for title in titles:
+        streak = 0
+        words = title_words(title)
+        if words:
+            title_len = len(words)
+            for run_sets in index:
+                if not any(
+                        not words.isdisjoint(card_words)
+                        and 2 * len(words & card_words) > min(title_len, len(card_words))
+                        for card_words in run_sets):
                     break
-        if found:
-            streak += 1
-        else:
-            break
+                streak += 1
+        streaks[title] = streak
+    return streaks
 
-    return streak
+
+def get_story_streak(title, history=None):
+    """How many consecutive runs has this story appeared?"""
+    return get_story_streaks([title], history)[title]
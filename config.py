@@ -4,10 +4,13 @@ Configuration: topics, sources, LLM models.
 
 import json
 import os
+from collections import namedtuple
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 
 
-TOPICS = {
+_TOPICS = {
     "world_politics": {
         "name": "World Politics & Geopolitics",
         "icon": "\U0001f30d",
@@ -52,7 +55,9 @@ TOPICS = {
 
 # Source format: (name, url, region, bias, language)
 # language: "en" for English, others for non-English (will be translated)
-RSS_SOURCES = [
+Source = namedtuple("Source", "name url region bias language")
+
+_RSS_ROWS = [
     # === CANADA - Mainstream ===
     ("Globe and Mail", "https://www.theglobeandmail.com/arc/outboundfeeds/rss/category/news/", "Canada", "centre", "en"),
     ("CBC News", "https://www.cbc.ca/webfeed/rss/rss-topstories", "Canada", "centre-left", "en"),
@@ -213,7 +218,12 @@ RSS_SOURCES = [
     ("New Scientist", "https://www.newscientist.com/feed/home/", "UK-Science", "centre", "en"),
 ]
 
-LLM_CONFIGS = {
+# Named records are still tuples, so positional unpacking in fetch keeps
+# working; RSS_SOURCES_BY_NAME resolves a source name in one hash lookup
+RSS_SOURCES = [Source._make(row) for row in _RSS_ROWS]
+RSS_SOURCES_BY_NAME = {s.name: s for s in RSS_SOURCES}
+
+_LLM_CONFIGS = {
     "gemini": {
         "provider": "google", "model": "gemini-2.5-flash",
         "env_key": "GOOGLE_API_KEY", "label": "Gemini Flash",
@@ -241,6 +251,20 @@ LLM_CONFIGS = {
     },
 }
 
+# Read-only views: these tables are shared module state and feed cached
+# lookups (_filter_topics, llm's available-model cache), so nothing may edit them
+TOPICS = MappingProxyType({k: MappingProxyType(v) for k, v in _TOPICS.items()})
+LLM_CONFIGS = MappingProxyType({k: MappingProxyType(v) for k, v in _LLM_CONFIGS.items()})
+
+# Client-side request budget per provider (requests per rolling minute).
+# Replaces fixed sleeps between calls now that calls run concurrently.
+PROVIDER_RATE_LIMITS = {
+    "google": 60,
+    "openai": 60,
+    "anthropic": 50,
+    "xai": 60,
+}
+
 
 # Materiality threshold: stories with avg importance below this are dropped
 MATERIALITY_CUTOFF = 3.5  # on 1-10 scale
@@ -256,22 +280,56 @@ DEPTH_THRESHOLDS = {
 }
 
 
+# Parsed packs keyed by path, each stamped with the file's (mtime, size)
+_pack_cache = {}
+
+
 def load_query_pack(path):
-    if not path or not Path(path).exists():
+    if not path:
         return None
-    with open(path) as f:
-        return json.load(f)
+    try:
+        st = Path(path).stat()
+    except OSError:
+        return None
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _pack_cache.get(path)
+    if cached and cached[0] == stamp:
+        return cached[1]
+    data = json.loads(Path(path).read_bytes())
+    _pack_cache[path] = (stamp, data)
+    return data
+
+
+@lru_cache(maxsize=32)
+def _filter_sources(names):
+    """Sources for the tuple of names, in pack order, as a shared tuple.
+
+    Looks each name up in RSS_SOURCES_BY_NAME rather than scanning every
+    source, so a short pack costs only its own length.
+    """
+    picked = {}
+    for name in names:
+        source = RSS_SOURCES_BY_NAME.get(name)
+        if source is None:
+            print("    Warning: query pack names unknown source {!r}".format(name))
+        else:
+            picked.setdefault(name, source)
+    return tuple(picked.values())
+
+
+@lru_cache(maxsize=32)
+def _filter_topics(allowed):
+    """TOPICS restricted to the frozenset allowed. Shared between calls."""
+    return MappingProxyType({k: v for k, v in TOPICS.items() if k in allowed})
 
 
 def get_active_sources(pack=None):
     if pack and "sources" in pack and pack["sources"] != "all":
-        allowed = set(pack["sources"])
-        return [s for s in RSS_SOURCES if s[0] in allowed]
+        return _filter_sources(tuple(pack["sources"]))
     return RSS_SOURCES
 
 
 def get_active_topics(pack=None):
     if pack and "topics" in pack:
-        allowed = set(pack["topics"])
-        return {k: v for k, v in TOPICS.items() if k in allowed}
+        return _filter_topics(frozenset(pack["topics"]))
     return TOPICS
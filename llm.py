@@ -6,67 +6,276 @@ Supports retry on rate limits and optional response caching.
 import hashlib
 import json
 import os
+import random
+import re
+import tempfile
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from pathlib import Path
 
 import requests
+from requests.adapters import HTTPAdapter
 
-from config import LLM_CONFIGS
+from config import LLM_CONFIGS, PROVIDER_RATE_LIMITS
 
 # Simple in-memory cache for this run (avoids re-calling for identical prompts)
 _cache = {}
 
+# On-disk cache keyed by the same content hash, so a re-run over the same
+# stories (crash, prompt tweak elsewhere) doesn't re-bill identical calls.
+# Grounded (web_search) calls are never persisted: their answers go stale.
+DISK_CACHE_DIR = Path(".llm_cache")
+DISK_CACHE_MAX_AGE = 3 * 24 * 3600  # seconds
+_disk_cache_swept = False
+_disk_cache_lock = threading.Lock()
+
+# Retry policy for rate limits (429), overloaded/5xx responses and dropped
+# connections; anything else (bad request, auth) fails immediately
+MAX_ATTEMPTS = 5
+BACKOFF_BASE = 2  # seconds; doubles each attempt
+MAX_RETRY_WAIT = 60  # cap on a single wait and on total waiting per call
+RETRY_STATUSES = {429, 500, 502, 503, 504, 529}
+_TRANSIENT_ERRORS = (requests.exceptions.Timeout, requests.exceptions.ConnectionError,
+                     requests.exceptions.ChunkedEncodingError)
+
+# One pooled session for all providers so TCP/TLS connections are reused
+# across calls instead of re-handshaking every request. Retries are ours.
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=0))
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Reply-parsing patterns, compiled once for every step module
+_FENCE_JSON = re.compile(r'```json\s*')
+_FENCE = re.compile(r'```\s*')
+_JSON_DECODER = json.JSONDecoder()
+
+# Sliding one-minute window of request start times per provider
+_rate_windows = {}
+_rate_lock = threading.Lock()
+
 
 def get_available_llms(exclude=None):
-    exclude = exclude or []
-    return [k for k, v in LLM_CONFIGS.items()
-            if k not in exclude and os.environ.get(v["env_key"])]
+    """LLM ids with an API key set, in LLM_CONFIGS order. Keys don't change
+    mid-run, so the scan is cached; callers get their own list."""
+    return list(_available_llms(tuple(exclude or ())))
 
 
-def call_by_id(llm_id, system_prompt, user_prompt, max_tokens=1500, use_cache=True, web_search=False):
-    """Call an LLM by its config ID. web_search=True enables Gemini grounding."""
+@lru_cache(maxsize=8)
+def _available_llms(exclude):
+    return tuple(k for k, v in LLM_CONFIGS.items()
+                 if k not in exclude and os.environ.get(v["env_key"]))
+
+
+def call_by_id(llm_id, system_prompt, user_prompt, max_tokens=1500, use_cache=True, web_search=False,
+               json_mode=False):
+    """Call an LLM by its config ID. web_search=True enables Gemini grounding.
+    json_mode=True asks Gemini for a bare JSON response (ignored by other providers)."""
     config = LLM_CONFIGS[llm_id]
     api_key = os.environ.get(config["env_key"])
     if not api_key:
         return None
     return call(config["provider"], config["model"],
-                system_prompt, user_prompt, api_key, max_tokens, use_cache, web_search)
+                system_prompt, user_prompt, api_key, max_tokens, use_cache, web_search, json_mode)
+
+
+def call_many(requests_list, max_workers=None):
+    """Fan out several call_by_id requests concurrently.
+
+    requests_list is a list of (llm_id, system_prompt, user_prompt, max_tokens)
+    tuples. Calls are network-bound, so they overlap on threads; results come
+    back in the same order as the input (None for failures).
+    """
+    if not requests_list:
+        return []
+    workers = max_workers or len(requests_list)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(call_by_id, *args) for args in requests_list]
+        return [f.result() for f in futures]
+
 
+def clip(text, limit):
+    """Shorten text to at most limit chars for a prompt, ending on a sentence
+    boundary (or failing that, a word boundary) instead of mid-word."""
+    if not text or len(text) <= limit:
+        return text
+    cut = text[:limit]
+    end = max(cut.rfind(". "), cut.rfind("! "), cut.rfind("? "), cut.rfind("\n"))
+    if end >= limit // 2:
+        return cut[:end + 1].rstrip()
+    space = cut.rfind(" ")
+    return cut[:space] if space > 0 else cut
 
-def call(provider, model, system_prompt, user_prompt, api_key, max_tokens=1500, use_cache=True, web_search=False):
+
+def strip_fences(text):
+    """Remove markdown code fences from an LLM reply."""
+    return _FENCE.sub('', _FENCE_JSON.sub('', text)).strip()
+
+
+def parse_json(text, array=False):
+    """Parse the JSON array (array=True) or object in an LLM reply, ignoring
+    code fences and surrounding prose. Raises ValueError on bad JSON."""
+    cleaned = strip_fences(text)
+    # Decode the first complete value from its opening bracket in one pass;
+    # trailing prose (even with brackets in it) is simply left unread
+    start = cleaned.find("[" if array else "{")
+    if start < 0:
+        return json.loads(cleaned)
+    return _JSON_DECODER.raw_decode(cleaned, start)[0]
+
+
+def call(provider, model, system_prompt, user_prompt, api_key, max_tokens=1500, use_cache=True, web_search=False,
+         json_mode=False):
     """Unified LLM call with retry and optional caching."""
     if use_cache:
-        cache_key = hashlib.md5(
-            "{}:{}:{}:{}:{}".format(provider, model, system_prompt, user_prompt, web_search).encode()
-        ).hexdigest()
+        cache_key = hashlib.blake2b(
+            "{}:{}:{}:{}:{}:{}:{}".format(provider, model, system_prompt, user_prompt, max_tokens,
+                                          web_search, json_mode).encode(),
+            digest_size=16).hexdigest()
         if cache_key in _cache:
             return _cache[cache_key]
+        if not web_search:
+            cached = _disk_cache_get(cache_key)
+            if cached:
+                _cache[cache_key] = cached
+                return cached
     else:
         cache_key = None
 
-    for attempt in range(3):
+    waited = 0
+    for attempt in range(MAX_ATTEMPTS):
         try:
-            result = _call_once(provider, model, system_prompt, user_prompt, api_key, max_tokens, web_search)
+            _throttle(provider)
+            result = _call_once(provider, model, system_prompt, user_prompt, api_key, max_tokens, web_search,
+                                json_mode)
             if result and cache_key:
                 _cache[cache_key] = result
+                if not web_search:
+                    _disk_cache_put(cache_key, result)
             return result
         except requests.exceptions.HTTPError as e:
-            if e.response is not None and e.response.status_code == 429:
-                wait = (attempt + 1) * 8
-                print("    ... rate limited, waiting {}s (attempt {}/3)".format(wait, attempt + 1))
-                time.sleep(wait)
-            else:
-                code = e.response.status_code if e.response else "unknown"
+            code = e.response.status_code if e.response is not None else "unknown"
+            if code not in RETRY_STATUSES:
                 print("  X {}/{}: HTTP {}".format(provider, model, code))
                 return None
+            reason = "rate limited" if code == 429 else "HTTP {}".format(code)
+            wait = _retry_delay(e.response, attempt)
+        except _TRANSIENT_ERRORS as e:
+            reason = type(e).__name__
+            wait = _retry_delay(None, attempt)
         except Exception as e:
             print("  X {}/{}: {}".format(provider, model, str(e)[:100]))
             return None
+
+        wait = min(wait, MAX_RETRY_WAIT - waited)
+        if attempt + 1 == MAX_ATTEMPTS or wait <= 0:
+            print("  X {}/{}: still {} after {} attempts".format(provider, model, reason, attempt + 1))
+            return None
+        print("    ... {}, waiting {:.0f}s (attempt {}/{})".format(reason, wait, attempt + 1, MAX_ATTEMPTS))
+        time.sleep(wait)
+        waited += wait
     return None
 
 
-def _call_once(provider, model, system_prompt, user_prompt, api_key, max_tokens, web_search=False):
+def _retry_delay(response, attempt):
+    """Seconds to wait before retrying: what the provider asks for via
+    Retry-After (or Anthropic's reset timestamp), but never less than
+    exponential backoff with jitter, so concurrent callers don't retry in
+    lockstep. response is None for connection errors."""
+    wait = BACKOFF_BASE * 2 ** attempt + random.uniform(0, 1)
+    if response is None:
+        return min(wait, MAX_RETRY_WAIT)
+    retry_after = response.headers.get("retry-after")
+    if retry_after:
+        try:
+            wait = max(wait, float(retry_after))
+        except ValueError:
+            try:
+                wait = max(wait, (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds())
+            except (TypeError, ValueError):
+                pass
+    reset = response.headers.get("anthropic-ratelimit-requests-reset")
+    if reset:
+        try:
+            reset_at = datetime.fromisoformat(reset)
+            if reset_at.tzinfo is None:
+                reset_at = reset_at.replace(tzinfo=timezone.utc)
+            wait = max(wait, (reset_at - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError):
+            pass
+    return min(wait, MAX_RETRY_WAIT)
+
+
+def _throttle(provider):
+    """Block until the provider is under its per-minute request budget."""
+    limit = PROVIDER_RATE_LIMITS.get(provider)
+    if not limit:
+        return
+    while True:
+        with _rate_lock:
+            window = _rate_windows.setdefault(provider, deque())
+            now = time.monotonic()
+            while window and now - window[0] >= 60:
+                window.popleft()
+            if len(window) < limit:
+                window.append(now)
+                return
+            wait = 60 - (now - window[0])
+        time.sleep(wait)
+
+
+def _disk_cache_get(key):
+    path = DISK_CACHE_DIR / (key + ".txt")
+    try:
+        if time.time() - path.stat().st_mtime > DISK_CACHE_MAX_AGE:
+            path.unlink()
+            return None
+        return path.read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+def _disk_cache_sweep():
+    """Delete expired entries (and temp files left by killed writes), once
+    per process, so the cache directory doesn't grow without bound."""
+    global _disk_cache_swept
+    with _disk_cache_lock:
+        if _disk_cache_swept:
+            return
+        _disk_cache_swept = True
+    cutoff = time.time() - DISK_CACHE_MAX_AGE
+    for path in DISK_CACHE_DIR.iterdir():
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+        except OSError:
+            pass
+
+
+def _disk_cache_put(key, text):
+    try:
+        DISK_CACHE_DIR.mkdir(exist_ok=True)
+        _disk_cache_sweep()
+        # Write to a temp file and rename it into place, so a run killed
+        # mid-write never leaves a truncated reply to be served later
+        with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=DISK_CACHE_DIR,
+                                         suffix=".tmp", delete=False) as f:
+            f.write(text)
+        os.replace(f.name, DISK_CACHE_DIR / (key + ".txt"))
+    except OSError:
+        pass
+
+
+def _call_once(provider, model, system_prompt, user_prompt, api_key, max_tokens, web_search=False,
+               json_mode=False):
     if provider == "google":
-        url = "https://generativelanguage.googleapis.com/v1beta/models/{}:generateContent?key={}".format(model, api_key)
+        url = "https://generativelanguage.googleapis.com/v1beta/models/{}:streamGenerateContent?alt=sse&key={}".format(
+            model, api_key)
         gen_config = {"maxOutputTokens": max_tokens, "temperature": 0.3}
         # Disable or minimize thinking to preserve output token budget
         # Gemini 2.5 Flash: disable thinking entirely (thinkingBudget: 0)
@@ -75,6 +284,10 @@ def _call_once(provider, model, system_prompt, user_prompt, api_key, max_tokens,
             gen_config["thinkingConfig"] = {"thinkingBudget": 128}
         else:
             gen_config["thinkingConfig"] = {"thinkingBudget": 0}
+        # Structured output: no prose or code fences around the JSON.
+        # Not combinable with grounding, so only when search is off.
+        if json_mode and not web_search:
+            gen_config["responseMimeType"] = "application/json"
         payload = {
             "systemInstruction": {"parts": [{"text": system_prompt}]},
             "contents": [{"parts": [{"text": user_prompt}]}],
@@ -82,17 +295,19 @@ def _call_once(provider, model, system_prompt, user_prompt, api_key, max_tokens,
         }
         if web_search:
             payload["tools"] = [{"google_search": {}}]
-        resp = requests.post(url, json=payload, timeout=120)
-        resp.raise_for_status()
-        data = resp.json()
-        candidate = data["candidates"][0]
+        text_parts = []
+        finish = ""
+        with _session.post(url, data=_encode(payload), headers=JSON_HEADERS, timeout=120, stream=True) as resp:
+            resp.raise_for_status()
+            for chunk in _sse_events(resp):
+                for candidate in chunk.get("candidates", [])[:1]:
+                    finish = candidate.get("finishReason", finish)
+                    parts = candidate.get("content", {}).get("parts", [])
+                    text_parts.extend(p["text"] for p in parts if "text" in p)
         # Check finish reason
-        finish = candidate.get("finishReason", "")
         if finish == "MAX_TOKENS":
             print("    WARNING: Gemini hit max tokens ({})".format(max_tokens))
-        parts = candidate["content"]["parts"]
-        text_parts = [p["text"] for p in parts if "text" in p]
-        return "\n".join(text_parts)
+        return "".join(text_parts)
 
     elif provider == "openai":
         url = "https://api.openai.com/v1/chat/completions"
@@ -103,16 +318,13 @@ def _call_once(provider, model, system_prompt, user_prompt, api_key, max_tokens,
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_prompt}
             ],
-            "max_tokens": max_tokens, "temperature": 0.3
+            "max_tokens": max_tokens, "temperature": 0.3, "stream": True
         }
-        resp = requests.post(url, headers=headers, json=payload, timeout=90)
-        resp.raise_for_status()
-        data = resp.json()
+        text, finish = _stream_chat_completion(url, headers, payload)
         # Check finish reason
-        finish = data["choices"][0].get("finish_reason", "")
         if finish == "length":
             print("    WARNING: ChatGPT hit max tokens ({})".format(max_tokens))
-        return data["choices"][0]["message"]["content"]
+        return text
 
     elif provider == "anthropic":
         url = "https://api.anthropic.com/v1/messages"
@@ -123,15 +335,24 @@ def _call_once(provider, model, system_prompt, user_prompt, api_key, max_tokens,
         payload = {
             "model": model, "max_tokens": max_tokens,
             "system": system_prompt,
-            "messages": [{"role": "user", "content": user_prompt}]
+            "messages": [{"role": "user", "content": user_prompt}],
+            "stream": True
         }
-        resp = requests.post(url, headers=headers, json=payload, timeout=90)
-        resp.raise_for_status()
-        data = resp.json()
+        text_parts = []
+        stop_reason = None
+        with _session.post(url, headers=headers, data=_encode(payload), timeout=90, stream=True) as resp:
+            resp.raise_for_status()
+            for event in _sse_events(resp):
+                if event.get("type") == "content_block_delta":
+                    text_parts.append(event["delta"].get("text", ""))
+                elif event.get("type") == "message_delta":
+                    stop_reason = event["delta"].get("stop_reason", stop_reason)
+                elif event.get("type") == "error":
+                    raise RuntimeError(event.get("error", {}).get("message", "stream error"))
         # Check finish reason
-        if data.get("stop_reason") == "max_tokens":
+        if stop_reason == "max_tokens":
             print("    WARNING: Claude hit max tokens ({})".format(max_tokens))
-        return data["content"][0]["text"]
+        return "".join(text_parts)
 
     elif provider == "xai":
         url = "https://api.x.ai/v1/chat/completions"
@@ -142,12 +363,44 @@ def _call_once(provider, model, system_prompt, user_prompt, api_key, max_tokens,
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_prompt}
             ],
-            "max_tokens": max_tokens, "temperature": 0.3
+            "max_tokens": max_tokens, "temperature": 0.3, "stream": True
         }
-        resp = requests.post(url, headers=headers, json=payload, timeout=90)
-        resp.raise_for_status()
-        data = resp.json()
-        finish = data["choices"][0].get("finish_reason", "")
+        text, finish = _stream_chat_completion(url, headers, payload)
+        # Check finish reason
         if finish == "length":
             print("    WARNING: Grok hit max tokens ({})".format(max_tokens))
-        return data["choices"][0]["message"]["content"]
+        return text
+
+
+def _stream_chat_completion(url, headers, payload):
+    """Read an OpenAI-style streamed chat completion. Returns (text, finish_reason)."""
+    text_parts = []
+    finish = ""
+    with _session.post(url, headers=headers, data=_encode(payload), timeout=90, stream=True) as resp:
+        resp.raise_for_status()
+        for chunk in _sse_events(resp):
+            if not chunk.get("choices"):
+                continue
+            choice = chunk["choices"][0]
+            text_parts.append(choice.get("delta", {}).get("content") or "")
+            finish = choice.get("finish_reason") or finish
+    return "".join(text_parts), finish
+
+
+def _encode(payload):
+    """Serialize a request body once, compactly, as UTF-8 bytes.
+    Non-ASCII stays raw instead of \\u-escaped, which keeps translated and
+    non-English prompts small on the wire."""
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _sse_events(resp):
+    """Yield the JSON payload of each server-sent event in a streamed response.
+    Lines stay as bytes: json.loads decodes UTF-8 itself, whatever the headers say."""
+    for raw in resp.iter_lines():
+        if not raw.startswith(b"data:"):
+            continue
+        data = raw[5:].strip()
+        if data == b"[DONE]":
+            break
+        yield json.loads(data)
@@ -6,7 +6,6 @@ Runs after quickscan, reads top cards.
 """
 
 import json
-import re
 
 import llm as llm_caller
 from models import StepReport
@@ -66,10 +65,7 @@ Rules:
         return {"watch": [], "prepare": [], "ignore": []}, report
 
     try:
-        cleaned = re.sub(r"```json\s*", "", result)
-        cleaned = re.sub(r"```\s*", "", cleaned).strip()
-        m = re.search(r"\{.*\}", cleaned, re.DOTALL)
-        actions = json.loads(m.group() if m else cleaned)
+        actions = llm_caller.parse_json(result)
         if not isinstance(actions, dict):
             raise ValueError("action payload is not object")
 
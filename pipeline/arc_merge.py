@@ -11,8 +11,6 @@ Uses multiple LLMs as voters to catch merges any single model might miss.
 """
 
 import json
-import re
-import time
 
 import llm as llm_caller
 from models import StoryCluster, StepReport
@@ -156,17 +154,13 @@ If no merges needed: {{"merges": []}}""".format(n=num_clusters, clusters=cluster
     result = llm_caller.call_by_id(llm_id,
         "News editor identifying duplicate and related stories. Return only JSON. Be aggressive about merging.",
         prompt, 3000)
-    time.sleep(0.5)
 
     if not result:
         report.llm_failures += 1
         return []
 
     try:
-        cleaned = re.sub(r'```json\s*', '', result)
-        cleaned = re.sub(r'```\s*', '', cleaned).strip()
-        m = re.search(r'\{.*\}', cleaned, re.DOTALL)
-        data = json.loads(m.group() if m else cleaned)
+        data = llm_caller.parse_json(result)
         report.llm_successes += 1
 
         merges = data.get("merges", data.get("arcs", []))
@@ -12,8 +12,6 @@ Approach:
 """
 
 import json
-import re
-import time
 
 import llm as llm_caller
 from models import StepReport
@@ -84,17 +82,13 @@ If no merges: {{"merges": []}}""".format(cards="\n".join(lines))
         result = llm_caller.call_by_id(llm_id,
             "News editor finding duplicate stories. Return only JSON. Be aggressive about merging.",
             prompt, 2000)
-        time.sleep(0.5)
 
         if not result:
             report.llm_failures += 1
             continue
 
         try:
-            cleaned = re.sub(r'```json\s*', '', result)
-            cleaned = re.sub(r'```\s*', '', cleaned).strip()
-            m = re.search(r'\{.*\}', cleaned, re.DOTALL)
-            data = json.loads(m.group() if m else cleaned)
+            data = llm_caller.parse_json(result)
             report.llm_successes += 1
 
             for merge in data.get("merges", []):
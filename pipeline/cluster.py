@@ -14,7 +14,7 @@ Approach:
 import hashlib
 import json
 import re
-import time
+from collections import defaultdict
 
 import llm as llm_caller
 from models import StoryCluster, StepReport
@@ -44,36 +44,52 @@ SKIP_WORDS = {
 }
 
 
+_NON_WORD = re.compile(r"[^a-zA-Z']")
+_NON_ALNUM = re.compile(r"[^a-z0-9\s]")
+
+
 def _extract_entities(text):
     entities = set()
     for word in text.split():
-        clean = re.sub(r"[^a-zA-Z']", "", word)
-        if clean and clean[0].isupper() and len(clean) > 2 and clean.lower() not in SKIP_WORDS:
-            entities.add(clean.lower())
+        clean = _NON_WORD.sub("", word)
+        if len(clean) > 2 and clean[0].isupper():
+            low = clean.lower()
+            if low not in SKIP_WORDS:
+                entities.add(low)
     return entities
 
 
 def _extract_terms(text):
-    words = set(re.sub(r"[^a-z0-9\s]", "", text.lower()).split())
+    words = set(_NON_ALNUM.sub("", text.lower()).split())
     return words - SKIP_WORDS - {""}
 
 
-def _similarity(a, b):
-    words_a = _extract_terms(a.title)
-    words_b = _extract_terms(b.title)
-    title_j = len(words_a & words_b) / max(len(words_a | words_b), 1) if words_a and words_b else 0
+def _features(a):
+    """(title terms, entities, summary terms) — computed once per article."""
+    return (_extract_terms(a.title),
+            _extract_entities(a.title + " " + a.summary),
+            _extract_terms(a.summary[:200]))
+
+
+def _jaccard(a, b):
+    """Jaccard of two sets; the union size is derived from the intersection."""
+    if not a or not b:
+        return 0
+    inter = len(a & b)
+    return inter / (len(a) + len(b) - inter)
 
-    text_a = a.title + " " + a.summary
-    text_b = b.title + " " + b.summary
-    ent_a = _extract_entities(text_a)
-    ent_b = _extract_entities(text_b)
-    shared = ent_a & ent_b if ent_a and ent_b else set()
-    ent_overlap = len(shared) / max(len(ent_a | ent_b), 1) if ent_a and ent_b else 0
-    key_bonus = 0.3 if len(shared) >= 3 else (0.15 if len(shared) >= 2 else 0)
 
-    sum_a = _extract_terms(a.summary[:200])
-    sum_b = _extract_terms(b.summary[:200])
-    sum_j = len(sum_a & sum_b) / max(len(sum_a | sum_b), 1) if sum_a and sum_b else 0
+def _similarity(fa, fb):
+    """Score two articles from their _features() tuples."""
+    words_a, ent_a, sum_a = fa
+    words_b, ent_b, sum_b = fb
+    title_j = _jaccard(words_a, words_b)
+
+    shared = len(ent_a & ent_b) if ent_a and ent_b else 0
+    ent_overlap = shared / (len(ent_a) + len(ent_b) - shared) if ent_a and ent_b else 0
+    key_bonus = 0.3 if shared >= 3 else (0.15 if shared >= 2 else 0)
+
+    sum_j = _jaccard(sum_a, sum_b)
 
     return title_j * 0.25 + ent_overlap * 0.35 + sum_j * 0.15 + key_bonus
 
@@ -82,7 +98,7 @@ def _cluster_id(articles):
     entities = set()
     for a in articles:
         entities.update(_extract_entities(a.title))
-    return hashlib.md5(",".join(sorted(entities)[:5]).encode()).hexdigest()[:10]
+    return hashlib.blake2b(",".join(sorted(entities)[:5]).encode(), digest_size=5).hexdigest()
 
 
 # ── Pass 1: Mechanical pre-grouping (HIGH threshold) ──────────────────────
@@ -93,16 +109,28 @@ def _mechanical_pregroup(articles):
     used = set()
     articles.sort(key=lambda a: a.relevance_score, reverse=True)
 
+    # Features are computed once per article, not once per pair.
+    # Inverted index: only score pairs that share at least one token.
+    features = [_features(a) for a in articles]
+    tokens = [f[0] | f[1] | f[2] for f in features]
+    index = defaultdict(set)
+    for i, toks in enumerate(tokens):
+        for t in toks:
+            index[t].add(i)
+
     for i, article in enumerate(articles):
         if i in used:
             continue
         group = [article]
         used.add(i)
-        for j, other in enumerate(articles[i+1:], start=i+1):
+        candidates = set()
+        for t in tokens[i]:
+            candidates |= index[t]
+        for j in sorted(c for c in candidates if c > i):
             if j in used:
                 continue
-            if _similarity(article, other) > 0.45:
-                group.append(other)
+            if _similarity(features[i], features[j]) > 0.45:
+                group.append(articles[j])
                 used.add(j)
         groups.append(group)
     return groups
@@ -118,7 +146,7 @@ def _llm_cluster_batch(article_list, report):
     lines = []
     for i, a in enumerate(article_list):
         lines.append('{}: [{}] "{}" — {}'.format(
-            i, a.source_name, a.title[:80], a.summary[:100]))
+            i, a.source_name, a.title[:80], llm_caller.clip(a.summary, 100)))
 
     prompt = """Group these articles by SPECIFIC EVENT. Articles about the same broad topic
 but different events must be in DIFFERENT groups.
@@ -142,17 +170,13 @@ Every article number must appear exactly once. Singles are fine — not every ar
     result = llm_caller.call_by_id("gemini",
         "You group news articles by specific event. Return only JSON. Be precise — same topic is NOT same event.",
         prompt, 2000)
-    time.sleep(0.5)
 
     if not result:
         report.llm_failures += 1
         return [[a] for a in article_list]
 
     try:
-        cleaned = re.sub(r'```json\s*', '', result)
-        cleaned = re.sub(r'```\s*', '', cleaned).strip()
-        m = re.search(r'\[.*\]', cleaned, re.DOTALL)
-        groups_indices = json.loads(m.group() if m else cleaned)
+        groups_indices = llm_caller.parse_json(result, array=True)
         report.llm_successes += 1
 
         # Convert index groups to article groups
@@ -219,7 +243,6 @@ def _llm_cluster_all(pregroups, report):
             sub = batch[i:i+25]
             groups = _llm_cluster_batch(sub, report)
             all_groups.extend(groups)
-            time.sleep(0.5)
 
     # No-topic articles as singletons
     for a in no_topic:
@@ -280,17 +303,13 @@ If all clusters are correct: {{"splits": {{}}, "ok": [0, 1, 2, ...]}}""".format(
     report.llm_calls += 1
     result = llm_caller.call_by_id("gemini",
         "Validate news clusters. Return JSON only.", prompt, 1500)
-    time.sleep(0.5)
 
     if not result:
         report.llm_failures += 1
         return groups
 
     try:
-        cleaned = re.sub(r'```json\s*', '', result)
-        cleaned = re.sub(r'```\s*', '', cleaned).strip()
-        m = re.search(r'\{.*\}', cleaned, re.DOTALL)
-        validation = json.loads(m.group() if m else cleaned)
+        validation = llm_caller.parse_json(result)
         report.llm_successes += 1
 
         splits = validation.get("splits", {})
@@ -361,11 +380,8 @@ def run(articles):
     clusters = []
     for g in groups:
         lead = g[0]
-        all_topics = []
-        for a in g:
-            for t in a.topics:
-                if t not in all_topics:
-                    all_topics.append(t)
+        # Ordered de-dup of every article's topics in one pass
+        all_topics = list(dict.fromkeys(t for a in g for t in a.topics))
         clusters.append(StoryCluster(
             articles=g,
             cluster_id=_cluster_id(g),
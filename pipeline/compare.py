@@ -3,12 +3,40 @@ Step 7: Cross-source comparison. Multi-model.
 Outputs structured contention assessment alongside comparison text.
 """
 
-import time
+import re
 
 import llm as llm_caller
 from config import LLM_CONFIGS
 from models import ComparisonResult, StepReport
 
+AGREEMENT_PHRASES = [
+    "no substantive contradictions",
+    "no genuine contradictions",
+    "no real disagreements",
+    "no significant disagreements",
+    "sources broadly agree",
+    "sources are largely consistent",
+    "no incompatible claims",
+    "complement rather than contradict",
+]
+
+DISPUTE_PHRASES = [
+    "contradicts", "incompatible claim", "directly conflicts",
+    "disputes the figure", "different numbers",
+    "conflicting accounts", "[high]",
+]
+
+
+def _phrase_pattern(phrases):
+    """Compile a phrase list into one alternation so text is scanned once."""
+    return re.compile("|".join(re.escape(p) for p in phrases))
+
+
+_AGREEMENT_RE = _phrase_pattern(AGREEMENT_PHRASES)
+_DISPUTE_RE = _phrase_pattern(DISPUTE_PHRASES)
+# Anything that ends the DISAGREEMENTS section, including a repeat of its header.
+_DISAGREEMENTS_END_RE = _phrase_pattern(["disagreements:", "framing", "key unknowns", "---"])
+
 
 def run(claims_data, lead_title):
     """Compare claims across sources. Returns (ComparisonResult, report)."""
@@ -62,13 +90,14 @@ Important questions the coverage leaves unanswered.""".format(
     if not comparators:
         comparators = available[:2] if len(available) >= 2 else available
 
-    for llm_id in comparators:
+    # Comparators are independent, so issue them concurrently
+    system = "Precise, evidence-based news auditor. Only reference provided extractions. Plain text."
+    results = llm_caller.call_many(
+        [(llm_id, system, prompt, 3000) for llm_id in comparators])
+
+    for llm_id, result in zip(comparators, results):
         config = LLM_CONFIGS[llm_id]
         report.llm_calls += 1
-        result = llm_caller.call_by_id(llm_id,
-            "Precise, evidence-based news auditor. Only reference provided extractions. Plain text.",
-            prompt, 3000)
-        time.sleep(2)
         if result:
             comparisons[config["label"]] = result
             report.llm_successes += 1
@@ -93,41 +122,23 @@ def _detect_contention(comparisons):
     combined = " ".join(comparisons.values()).lower()
 
     # Strong agreement signals
-    agreement_phrases = [
-        "no substantive contradictions",
-        "no genuine contradictions",
-        "no real disagreements",
-        "no significant disagreements",
-        "sources broadly agree",
-        "sources are largely consistent",
-        "no incompatible claims",
-        "complement rather than contradict",
-    ]
-    for phrase in agreement_phrases:
-        if phrase in combined:
-            return "straight_news"
-
-    # Strong dispute signals
-    dispute_phrases = [
-        "contradicts", "incompatible claim", "directly conflicts",
-        "disputes the figure", "different numbers",
-        "conflicting accounts", "[high]",
-    ]
-    dispute_count = sum(1 for p in dispute_phrases if p in combined)
+    if _AGREEMENT_RE.search(combined):
+        return "straight_news"
+
+    # Strong dispute signals (count distinct phrases, not occurrences)
+    dispute_count = len(set(_DISPUTE_RE.findall(combined)))
     if dispute_count >= 2:
         return "contested"
 
     # Check DISAGREEMENTS section length
     for text in comparisons.values():
         lower = text.lower()
-        if "disagreements:" in lower:
-            parts = lower.split("disagreements:")
-            if len(parts) > 1:
-                rest = parts[1]
-                for next_sec in ["framing", "key unknowns", "---"]:
-                    if next_sec in rest:
-                        rest = rest.split(next_sec)[0]
-                if len(rest.strip()) > 80:
-                    return "contested"
+        start = lower.find("disagreements:")
+        if start >= 0:
+            start += len("disagreements:")
+            end = _DISAGREEMENTS_END_RE.search(lower, start)
+            rest = lower[start:end.start() if end else len(lower)]
+            if len(rest.strip()) > 80:
+                return "contested"
 
     return "straight_news"
@@ -55,10 +55,8 @@ def run(topic_cards):
             card.political_balance = "unknown"
 
         # Geographic diversity
-        regions = set()
-        for s in sources:
-            base = s.get("region", "").split("-")[0]
-            regions.add(REGION_GROUPS.get(base, "Other"))
+        regions = {REGION_GROUPS.get(s.get("region", "").partition("-")[0], "Other")
+                   for s in sources}
         card.geo_diversity = len(regions)
         card.region_count = len(regions)
 
@@ -4,11 +4,15 @@ Includes hallucination check — verifies claims trace to source text.
 """
 
 import re
-import time
 
 import llm as llm_caller
 from models import ClaimSet, StepReport
 
+MAX_EXTRACT_WORKERS = 6
+
+_NUMBER = re.compile(r'\b\d[\d,.]+\b')
+_NAME = re.compile(r'[A-Z][a-z]+ [A-Z][a-z]+')  # capitalized two-word names
+
 
 def run(selected_sources):
     """Extract claims with hallucination checking. Returns (claims, report)."""
@@ -21,40 +25,18 @@ def run(selected_sources):
     flash_options = [k for k in available if k not in ("gemini_pro", "claude")]
     extractor_id = flash_options[0] if flash_options else available[0]
 
+    system = "Extract only what is explicitly stated. Never invent facts."
+    prompts = [(extractor_id, system, _build_prompt(item), 2000) for item in selected_sources]
+    # One provider, several sources: overlap the calls, bounded so a wide
+    # story doesn't burst past the provider's rate window
+    results = llm_caller.call_many(prompts, max_workers=MAX_EXTRACT_WORKERS)
+
     claims = []
-    for item in selected_sources:
+    for item, result in zip(selected_sources, results):
         article = item.article
-        perspective = item.perspective
         source_text = "{} {}".format(article.title, article.summary)
 
-        prompt = """Extract factual claims from this news article.
-
-SOURCE: {source}
-PERSPECTIVE: {perspective}
-HEADLINE: {title}
-CONTENT: {summary}
-
-Extract:
-CLAIMS (one per line):
-CLAIM: [specific fact] | TYPE: [REPORTED_FACT / OFFICIAL_STATEMENT / ANALYSIS / OPINION] | ATTR: [who said it]
-
-EMPHASIS: What does this source emphasize?
-FRAMING: Notable language choices or editorial angle? Quote specific phrases.
-NOTABLE_DETAILS: Specific numbers, dates, names, connections.
-
-CRITICAL: Only extract what is EXPLICITLY stated in the content above.
-Do NOT infer, assume, or add facts not present in the text.""".format(
-            source=article.source_label(),
-            perspective=perspective,
-            title=article.title,
-            summary=article.summary[:500])
-
         report.llm_calls += 1
-        result = llm_caller.call_by_id(extractor_id,
-            "Extract only what is explicitly stated. Never invent facts.",
-            prompt, 2000)
-        time.sleep(0.5)
-
         if not result:
             report.llm_failures += 1
             continue
@@ -68,7 +50,7 @@ Do NOT infer, assume, or add facts not present in the text.""".format(
             source_name=article.source_name,
             source_region=article.source_region,
             source_bias=article.source_bias,
-            perspective=perspective,
+            perspective=item.perspective,
             headline=article.title,
             url=article.url,
             extracted_text=result,
@@ -84,14 +66,39 @@ Do NOT infer, assume, or add facts not present in the text.""".format(
     return claims, report
 
 
+def _build_prompt(item):
+    article = item.article
+    return """Extract factual claims from this news article.
+
+SOURCE: {source}
+PERSPECTIVE: {perspective}
+HEADLINE: {title}
+CONTENT: {summary}
+
+Extract:
+CLAIMS (one per line):
+CLAIM: [specific fact] | TYPE: [REPORTED_FACT / OFFICIAL_STATEMENT / ANALYSIS / OPINION] | ATTR: [who said it]
+
+EMPHASIS: What does this source emphasize?
+FRAMING: Notable language choices or editorial angle? Quote specific phrases.
+NOTABLE_DETAILS: Specific numbers, dates, names, connections.
+
+CRITICAL: Only extract what is EXPLICITLY stated in the content above.
+Do NOT infer, assume, or add facts not present in the text.""".format(
+        source=article.source_label(),
+        perspective=item.perspective,
+        title=article.title,
+        summary=llm_caller.clip(article.summary, 500))
+
+
 def _check_hallucinations(extracted, source_text):
     """Check if extracted claims contain information not in source text."""
     flags = []
     source_lower = source_text.lower()
 
     # Extract specific numbers from the extraction
-    extracted_numbers = set(re.findall(r'\b\d[\d,.]+\b', extracted))
-    source_numbers = set(re.findall(r'\b\d[\d,.]+\b', source_text))
+    extracted_numbers = set(_NUMBER.findall(extracted))
+    source_numbers = set(_NUMBER.findall(source_text))
 
     # Numbers in extraction but not in source are suspicious
     phantom_numbers = extracted_numbers - source_numbers
@@ -105,9 +112,8 @@ def _check_hallucinations(extracted, source_text):
             pass
 
     # Extract quoted names (capitalized multi-word sequences)
-    name_pattern = re.compile(r'[A-Z][a-z]+ [A-Z][a-z]+')
-    extracted_names = set(name_pattern.findall(extracted))
-    source_names = set(name_pattern.findall(source_text))
+    extracted_names = set(_NAME.findall(extracted))
+    source_names = set(_NAME.findall(source_text))
     phantom_names = extracted_names - source_names
     for name in phantom_names:
         # Only flag if the name parts aren't individually present
@@ -3,28 +3,168 @@ Step 1: Fetch RSS feeds in parallel.
 Supports non-English sources — translates title+summary via LLM.
 """
 
+import io
+import json
 import re
+import xml.etree.ElementTree as ET
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict
+from pathlib import Path
 
-import feedparser
+import requests
+from requests.adapters import HTTPAdapter
 
 import llm as llm_caller
 from models import Article, StepReport
 
 
-def fetch_single_feed(name, url, region, bias, language="en"):
+HEADERS = {"User-Agent": "GlobalBriefing/3.0"}
+FEED_TIMEOUT = 15
+# Feed downloads are pure network wait, so overlap far more of them than
+# there are cores; parsing the downloaded bytes is cheap by comparison.
+MAX_FETCH_WORKERS = 64
+# Translations are one LLM call per non-English article; overlap a handful
+MAX_TRANSLATE_WORKERS = 8
+
+# One pooled session for every feed: several feeds share a host (BBC, Al
+# Jazeera, ...), so their downloads reuse kept-alive TLS connections
+_session = requests.Session()
+_session.headers.update(HEADERS)
+_adapter = HTTPAdapter(pool_connections=32, pool_maxsize=MAX_FETCH_WORKERS, max_retries=0)
+_session.mount("https://", _adapter)
+_session.mount("http://", _adapter)
+
+_HTML_TAG = re.compile(r"<[^>]+>")
+
+MAX_ENTRIES = 15
+_ATOM = "{http://www.w3.org/2005/Atom}"
+
+# Per-feed ETag/Last-Modified plus the articles parsed last time, so feeds
+# that answer 304 Not Modified are served from disk.
+FEED_CACHE_PATH = Path("output/feed_cache.json")
+
+
+def load_feed_cache():
+    """Load the conditional-GET cache. Returns {url: entry}."""
+    if not FEED_CACHE_PATH.exists():
+        return {}
+    try:
+        data = json.loads(FEED_CACHE_PATH.read_bytes())
+        return data if isinstance(data, dict) else {}
+    except (ValueError, OSError):  # JSONDecodeError or bad UTF-8
+        return {}
+
+
+def save_feed_cache(cache):
+    FEED_CACHE_PATH.parent.mkdir(exist_ok=True)
+    # Compact, raw UTF-8: the cache holds every article of every feed and is
+    # re-read on each run, so whitespace and \u escapes are pure overhead
+    FEED_CACHE_PATH.write_bytes(
+        json.dumps(cache, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+
+def _download(url, cached=None):
+    """Fetch raw feed bytes with a hard timeout so one slow feed can't stall the stage.
+    Returns (content, response); content is None when the feed is unchanged (304)."""
+    headers = {}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("modified"):
+            headers["If-Modified-Since"] = cached["modified"]
+    resp = _session.get(url, headers=headers, timeout=FEED_TIMEOUT)
+    if resp.status_code == 304:
+        return None, resp
+    resp.raise_for_status()
+    return resp.content, resp
+
+
+def _element_text(elem):
+    return "".join(elem.itertext()) if elem is not None else ""
+
+
+def _atom_link(entry):
+    links = entry.findall(_ATOM + "link")
+    for link in links:
+        if link.get("rel", "alternate") == "alternate":
+            return link.get("href", "")
+    return links[0].get("href", "") if links else ""
+
+
+def _stream_entries(content):
+    """Pull the first MAX_ENTRIES RSS items / Atom entries off the XML and stop,
+    instead of building the whole document. Raises ET.ParseError on bad XML."""
+    entries = []
+    for _, elem in ET.iterparse(io.BytesIO(content), events=("end",)):
+        if elem.tag == "item":
+            entries.append({
+                "title": _element_text(elem.find("title")),
+                "link": _element_text(elem.find("link")),
+                "summary": _element_text(elem.find("description")),
+                "published": _element_text(elem.find("pubDate")),
+            })
+        elif elem.tag == _ATOM + "entry":
+            summary = elem.find(_ATOM + "summary")
+            if summary is None:
+                summary = elem.find(_ATOM + "content")
+            published = elem.find(_ATOM + "published")
+            if published is None:
+                published = elem.find(_ATOM + "updated")
+            entries.append({
+                "title": _element_text(elem.find(_ATOM + "title")),
+                "link": _atom_link(elem),
+                "summary": _element_text(summary),
+                "published": _element_text(published),
+            })
+        else:
+            continue
+        elem.clear()
+        if len(entries) >= MAX_ENTRIES:
+            break
+    return entries
+
+
+def _parse_entries(content):
+    """Fast streaming parse, with feedparser as the fallback for malformed
+    or unusual feeds (RDF, bad entities, encoding problems)."""
+    try:
+        entries = _stream_entries(content)
+        if entries:
+            return entries
+    except ET.ParseError:
+        pass
+    # Imported only when needed: most feeds never reach the fallback, and
+    # feedparser costs ~50ms of startup to import
+    import feedparser
+    feed = feedparser.parse(content)
+    if feed.bozo and not feed.entries:
+        return []
+    return feed.entries[:MAX_ENTRIES]
+
+
+def fetch_single_feed(name, url, region, bias, language="en", cache=None):
+    """Fetch and parse one feed. If cache is given, send a conditional GET and
+    record the new validators and articles in it."""
     articles = []
+    cached = cache.get(url) if cache is not None else None
     try:
-        feed = feedparser.parse(url, request_headers={"User-Agent": "GlobalBriefing/3.0"})
-        if feed.bozo and not feed.entries:
-            return articles
-        for entry in feed.entries[:15]:
+        content, resp = _download(url, cached)
+        if content is None:
+            try:
+                return [Article(**a) for a in cached.get("articles", [])]
+            except TypeError:
+                # Cached with an older Article shape. The server will keep
+                # answering 304 to these validators, so drop the entry and
+                # download the feed in full.
+                cache.pop(url, None)
+                content, resp = _download(url)
+        for entry in _parse_entries(content):
             title = entry.get("title", "").strip()
             link = entry.get("link", "").strip()
             if not title or not link:
                 continue
             summary = entry.get("summary", entry.get("description", ""))
-            summary = re.sub(r"<[^>]+>", "", summary or "")[:500]
+            summary = _HTML_TAG.sub("", summary or "")[:500]
             published = entry.get("published", entry.get("updated", ""))
             articles.append(Article(
                 title=title, url=link, source_name=name,
@@ -32,20 +172,36 @@ def fetch_single_feed(name, url, region, bias, language="en"):
                 summary=summary, published=published,
                 language=language,
             ))
+        if cache is not None and (resp.headers.get("ETag") or resp.headers.get("Last-Modified")):
+            cache[url] = {
+                "etag": resp.headers.get("ETag"),
+                "modified": resp.headers.get("Last-Modified"),
+                "articles": [asdict(a) for a in articles],
+            }
     except Exception:
         pass
     return articles
 
 
+TRANSLATE_SYSTEM = "You are a translator. Return only the English translation. Format: Title: ...\nSummary: ..."
+
+
+def _translation_request(article):
+    """call_many request tuple translating one article."""
+    prompt = "Translate to English. Return ONLY the translation, nothing else.\n\nTitle: {}\nSummary: {}".format(
+        article.title, llm_caller.clip(article.summary, 300))
+    return ("gemini", TRANSLATE_SYSTEM, prompt, 400)
+
+
 def translate_article(article):
     """Translate non-English article title + summary to English."""
     if article.language == "en":
         return article
-    prompt = "Translate to English. Return ONLY the translation, nothing else.\n\nTitle: {}\nSummary: {}".format(
-        article.title, article.summary[:300])
-    result = llm_caller.call_by_id("gemini",
-        "You are a translator. Return only the English translation. Format: Title: ...\nSummary: ...",
-        prompt, 400)
+    return _apply_translation(article, llm_caller.call_by_id(*_translation_request(article)))
+
+
+def _apply_translation(article, result):
+    """Copy a translator reply's Title:/Summary: lines onto the article."""
     if result:
         lines = result.strip().split("\n", 1)
         for line in lines:
@@ -61,33 +217,38 @@ def run(sources):
     print("\n>>> FETCH: {} sources...".format(len(sources)))
     report = StepReport("fetch", items_in=len(sources))
 
-    all_articles = []
-    with ThreadPoolExecutor(max_workers=20) as executor:
+    cache = load_feed_cache()
+    # Deduplicate by URL as each feed lands, so repeats are never collected
+    seen = set()
+    unique = []
+    workers = max(1, min(MAX_FETCH_WORKERS, len(sources)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
         futures = {
-            executor.submit(fetch_single_feed, *s): s[0]
+            executor.submit(fetch_single_feed, *s, cache=cache): s[0]
             for s in sources
         }
         for future in as_completed(futures):
-            all_articles.extend(future.result())
-
-    # Deduplicate by URL
-    seen = set()
-    unique = []
-    for a in all_articles:
-        if a.url not in seen:
-            seen.add(a.url)
-            unique.append(a)
+            for a in future.result():
+                if a.url not in seen:
+                    seen.add(a.url)
+                    unique.append(a)
+    # Keep only feeds still being fetched, so the committed cache file
+    # doesn't keep entries for sources that left the pack
+    active = {s[1] for s in sources}
+    save_feed_cache({url: entry for url, entry in cache.items() if url in active})
 
     # Translate non-English articles
     non_en = [a for a in unique if a.language != "en"]
     if non_en:
         print("    Translating {} non-English articles...".format(len(non_en)))
-        translated = 0
-        for a in non_en:
-            translate_article(a)
-            translated += 1
-            report.llm_calls += 1
-            report.llm_successes += 1
+        # Fan the calls out together instead of waiting on each in turn
+        results = llm_caller.call_many([_translation_request(a) for a in non_en],
+                                       max_workers=MAX_TRANSLATE_WORKERS)
+        for a, result in zip(non_en, results):
+            _apply_translation(a, result)
+        translated = sum(1 for r in results if r)
+        report.llm_calls += len(non_en)
+        report.llm_successes += translated
         print("    {} translated".format(translated))
 
     report.items_out = len(unique)
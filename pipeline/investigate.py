@@ -5,12 +5,31 @@ If investigation adds nothing new, it says so explicitly.
 Only runs for DEEP tier stories.
 """
 
-import time
+import re
 
 import llm as llm_caller
 from config import LLM_CONFIGS
 from models import InvestigationResult, StepReport
 
+# Verdict signals, each list compiled to one alternation so the
+# investigation text is swept once per verdict instead of once per phrase.
+ADDS_VALUE_SIGNALS = [
+    "yes —", "yes—", "yes -",
+    "materially changes", "crucial context",
+    "contradicted by", "omits",
+]
+NO_VALUE_SIGNALS = [
+    "no —", "no—", "no -",
+    "substantially accurate", "coverage is adequate",
+    "confirms what", "consistent with",
+]
+_ADDS_VALUE_RE = re.compile("|".join(re.escape(s) for s in ADDS_VALUE_SIGNALS))
+_NO_VALUE_RE = re.compile("|".join(re.escape(s) for s in NO_VALUE_SIGNALS))
+_FACTS_END_RE = re.compile("DISAGREEMENTS:|FRAMING|KEY UNKNOWNS:")
+IMPACT_MARKERS = ["STORY IMPACT:", "Story Impact:", "story impact:"]
+YES_MARKERS = ["YES —", "YES -", "Yes —"]
+_ANY_IMPACT_MARKER_RE = re.compile("|".join(re.escape(m) for m in IMPACT_MARKERS + YES_MARKERS))
+
 
 def run(comparison_result, claims_data, lead_title):
     """Investigate and frame findings as story impact. Returns (InvestigationResult, report)."""
@@ -32,9 +51,9 @@ def run(comparison_result, claims_data, lead_title):
     for model, text in comparison_result.comparisons.items():
         if "AGREED FACTS:" in text:
             facts = text.split("AGREED FACTS:")[-1]
-            for next_sec in ["DISAGREEMENTS:", "FRAMING", "KEY UNKNOWNS:"]:
-                if next_sec in facts:
-                    facts = facts.split(next_sec)[0]
+            end = _FACTS_END_RE.search(facts)
+            if end:
+                facts = facts[:end.start()]
             coverage_summary = facts.strip()[:500]
             break
 
@@ -91,7 +110,6 @@ Plain text only. Complete every sentence.""".format(
     result = llm_caller.call_by_id(investigator_id,
         "Research analyst. Be honest about whether findings add value. Plain text only.",
         prompt, 3000, web_search=use_search)
-    time.sleep(1)
 
     if not result:
         report.llm_failures += 1
@@ -114,19 +132,10 @@ Plain text only. Complete every sentence.""".format(
 def _assess_value(text):
     """Determine if investigation found something that changes the story."""
     lower = text.lower()
-    # Explicit "yes" signals
-    if "yes —" in lower or "yes—" in lower or "yes -" in lower:
-        return True
-    if "materially changes" in lower or "crucial context" in lower:
-        return True
-    if "contradicted by" in lower or "omits" in lower:
+    # Explicit "yes" signals win over explicit "no" signals
+    if _ADDS_VALUE_RE.search(lower):
         return True
-    # Explicit "no" signals
-    if "no —" in lower or "no—" in lower or "no -" in lower:
-        return False
-    if "substantially accurate" in lower or "coverage is adequate" in lower:
-        return False
-    if "confirms what" in lower or "consistent with" in lower:
+    if _NO_VALUE_RE.search(lower):
         return False
     # Default: if there's a STORY IMPACT section with content, it adds value
     if "story impact:" in lower:
@@ -137,8 +146,12 @@ def _assess_value(text):
 
 def _extract_impact(text):
     """Extract the story impact statement."""
+    # Unstructured replies carry no marker at all: one scan rules that out
+    if not _ANY_IMPACT_MARKER_RE.search(text):
+        return ""
+
     # Look for explicit impact section
-    for marker in ["STORY IMPACT:", "Story Impact:", "story impact:"]:
+    for marker in IMPACT_MARKERS:
         if marker in text:
             impact = text.split(marker)[-1].strip()
             # Take first 2-3 sentences
@@ -146,7 +159,7 @@ def _extract_impact(text):
             return ". ".join(sentences[:3]) + "." if sentences else ""
 
     # Look for "YES —" explanation
-    for marker in ["YES —", "YES —", "YES -", "Yes —"]:
+    for marker in YES_MARKERS:
         if marker in text:
             explanation = text.split(marker)[-1].strip()
             sentences = [s.strip() for s in explanation.split(".") if s.strip()]
@@ -5,8 +5,7 @@ No artificial limit on perspective count.
 """
 
 import json
-import re
-import time
+from collections import defaultdict
 
 import llm as llm_caller
 from config import LLM_CONFIGS
@@ -23,7 +22,7 @@ def run(cluster):
         source_lines.append(
             '- {} (region: {}, leaning: {}): "{}" — {}'.format(
                 a.source_name, a.source_region, a.source_bias,
-                a.title, a.summary[:120]))
+                a.title, llm_caller.clip(a.summary, 120)))
     source_list = "\n".join(source_lines)
 
     prompt = """Look at these sources covering the same story and identify what different angles they bring.
@@ -65,22 +64,16 @@ Rules:
     all_missing = []
 
     available = [k for k in llm_caller.get_available_llms() if k != "gemini_pro"][:2]
-    for llm_id in available:
+    system = "You analyze news perspectives. Return only JSON."
+    results = llm_caller.call_many([(llm_id, system, prompt, 2000) for llm_id in available])
+    for llm_id, result in zip(available, results):
         report.llm_calls += 1
-        result = llm_caller.call_by_id(llm_id,
-            "You analyze news perspectives. Return only JSON.",
-            prompt, 2000)
-        time.sleep(1)
-
         if not result:
             report.llm_failures += 1
             continue
 
         try:
-            cleaned = re.sub(r'```json\s*', '', result)
-            cleaned = re.sub(r'```\s*', '', cleaned).strip()
-            m = re.search(r'\{.*\}', cleaned, re.DOTALL)
-            data = json.loads(m.group() if m else cleaned)
+            data = llm_caller.parse_json(result)
             report.llm_successes += 1
 
             for p in data.get("perspectives", []):
@@ -118,13 +111,15 @@ def _merge_perspectives(perspectives):
     if not perspectives:
         return []
     merged = []
+    merged_words = []  # label word set per merged entry; labels never change
+    by_word = defaultdict(list)  # word -> indexes into merged, ascending
     for p in perspectives:
-        label = p.get("label", "").lower().strip()
-        is_dup = False
-        for existing in merged:
-            ex_label = existing.get("label", "").lower().strip()
-            words_a = set(label.split())
-            words_b = set(ex_label.split())
+        words_a = set(p.get("label", "").lower().split())
+        # overlap > 0.4 needs a shared word, so only those entries are
+        # compared, still in merge order so the first match wins as before
+        candidates = sorted({i for w in words_a for i in by_word[w]})
+        for i in candidates:
+            existing, words_b = merged[i], merged_words[i]
             overlap = len(words_a & words_b) / max(len(words_a | words_b), 1)
             if overlap > 0.4:
                 # Merge sources
@@ -132,10 +127,12 @@ def _merge_perspectives(perspectives):
                 new_sources = set(p.get("sources", []))
                 existing["sources"] = list(ex_sources | new_sources)
                 existing["identified_by"] = existing.get("identified_by", "") + ", " + p.get("identified_by", "")
-                is_dup = True
                 break
-        if not is_dup:
+        else:
+            for w in words_a:
+                by_word[w].append(len(merged))
             merged.append(p)
+            merged_words.append(words_a)
     return merged
 
 
@@ -155,7 +152,7 @@ def _select_sources(cluster, perspectives):
             if src in available and src not in used:
                 a = available[src]
                 score = 1.0
-                region = a.source_region.split("-")[0]
+                region = a.source_region.partition("-")[0]
                 bias = a.source_bias.lower()
                 if region not in used_regions:
                     score += 0.5
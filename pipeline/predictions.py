@@ -10,8 +10,6 @@ Output feeds a "What's Coming" section in the briefing.
 """
 
 import json
-import re
-import time
 
 import llm as llm_caller
 from models import StepReport
@@ -114,17 +112,13 @@ RULES:
     result = llm_caller.call_by_id(predictor,
         "Intelligence analyst making structured predictions. Return only JSON. Be specific and concrete.",
         prompt, 4000)
-    time.sleep(1)
 
     if not result:
         report.llm_failures += 1
         return {}, report
 
     try:
-        cleaned = re.sub(r'```json\s*', '', result)
-        cleaned = re.sub(r'```\s*', '', cleaned).strip()
-        m = re.search(r'\{.*\}', cleaned, re.DOTALL)
-        data = json.loads(m.group() if m else cleaned)
+        data = llm_caller.parse_json(result)
         report.llm_successes += 1
 
         # Validate and clean predictions
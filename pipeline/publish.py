@@ -1,13 +1,36 @@
 """Step 11: Publish as HTML."""
 
+import html
 from datetime import datetime, timezone
+from functools import lru_cache
 
 import llm as llm_caller
 from config import TOPICS, LLM_CONFIGS
 
 
-def run(topic_cards, synthesis, quickscan_data, reports, run_time, quality_review=None, predictions_data=None, action_data=None):
+def run(topic_cards, synthesis, quickscan_data, reports, run_time, quality_review=None, predictions_data=None, action_data=None, available_llms=None):
     """Generate HTML. Returns html string."""
+    return "".join(render(topic_cards, synthesis, quickscan_data, reports, run_time,
+                          quality_review, predictions_data, action_data, available_llms))
+
+
+def write(path, topic_cards, synthesis, quickscan_data, reports, run_time, quality_review=None, predictions_data=None, action_data=None, available_llms=None):
+    """Generate HTML and write it to path chunk by chunk, one story card at
+    a time, without joining the whole page into one string first."""
+    chunks = render(topic_cards, synthesis, quickscan_data, reports, run_time,
+                    quality_review, predictions_data, action_data, available_llms)
+    with open(path, "w", encoding="utf-8") as f:
+        f.writelines(chunks)
+
+
+def render(topic_cards, synthesis, quickscan_data, reports, run_time, quality_review=None, predictions_data=None, action_data=None, available_llms=None):
+    """Generate HTML. Yields the page in chunks: the shell and page sections
+    around the stories, then each story card as it is rendered. Yields
+    nothing if the page itself fails to build.
+
+    available_llms is the caller's get_available_llms() result; it is looked
+    up again only when not passed.
+    """
     try:
         card_dicts = []
         for card in topic_cards:
@@ -27,17 +50,18 @@ def run(topic_cards, synthesis, quickscan_data, reports, run_time, quality_revie
             else:
                 card_dicts.append(card)
 
-        stories_html = "".join(_render_card(card, i) for i, card in enumerate(card_dicts))
         brief_html = _render_the_brief(card_dicts, predictions_data or {}, action_data or {})
         featured_editorial_html = _render_featured_editorial(card_dicts)
         synthesis_html = _render_synthesis(synthesis)
         filter_buttons = _render_filters()
         run_report_html = _render_run_report(reports, run_time)
         review_panel_html = _render_review_panel(quality_review)
-        llms_used = ", ".join(LLM_CONFIGS[k]["label"] for k in llm_caller.get_available_llms())
+        if available_llms is None:
+            available_llms = llm_caller.get_available_llms()
+        llms_used = ", ".join(LLM_CONFIGS[k]["label"] for k in available_llms)
         now = datetime.now(timezone.utc).strftime("%B %d, %Y at %H:%M UTC")
 
-        return HTML_TEMPLATE.format(
+        body_top = PAGE_BODY_TOP.format(
             date=now,
             num_stories=len(topic_cards),
             llms=llms_used,
@@ -45,19 +69,30 @@ def run(topic_cards, synthesis, quickscan_data, reports, run_time, quality_revie
             featured_editorial=featured_editorial_html,
             synthesis=synthesis_html,
             filters=filter_buttons,
-            stories=stories_html,
+            runtime=run_time,
+        )
+        body_bottom = PAGE_BODY_BOTTOM.format(
             run_report=run_report_html,
             review_panel=review_panel_html,
-            runtime=run_time,
         )
     except Exception:
-        return ""
+        return
+
+    yield PAGE_HEAD
+    yield body_top
+    # Cards are rendered and handed on one at a time, so only the card being
+    # written is held as HTML (_render_card handles its own failures)
+    for i, card in enumerate(card_dicts):
+        yield _render_card(card, i)
+    yield body_bottom
+    yield PAGE_TAIL
 
 
 def _esc(text):
+    """Escape for both text and attribute contexts (quotes included)."""
     if not text:
         return ""
-    return str(text).replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    return html.escape(str(text))
 
 
 def _normalize_action_data(action_data):
@@ -111,41 +146,61 @@ def _has_substantive_unknowns(card):
         return False
 
 
+# Markup for The Brief and its predictions box
+BRIEF_TEMPLATE = (
+    '<section class="the-brief"><h2>The Brief</h2><div class="brief-grid">{}</div>'
+    '<div class="brief-actions">{}</div>{}</section>'
+)
+BRIEF_ITEM_TEMPLATE = (
+    '<a class="brief-item" href="#topic-card-{idx}"><div class="brief-head">{title}</div>'
+    '{contested}{why}</a>'
+)
+BRIEF_WHY_TEMPLATE = '<div class="brief-why">{}</div>'
+BRIEF_ACTION_TEMPLATE = '<a href="#topic-card-{idx}" class="brief-action-item">{txt}</a>'
+BRIEF_ACTION_COL_TEMPLATE = '<div class="brief-action-col"><div class="brief-action-label">{}</div>{}</div>'
+PREDICTION_TEMPLATE = (
+    '<div class="pred-item"><div class="pred-text">{}</div>'
+    '<div class="pred-disconfirm">Would be wrong if: {}</div></div>'
+)
+PREDICTION_CATEGORY_TEMPLATE = '<div class="pred-category"><div class="pred-category-label">{}</div>{}</div>'
+
+
 def _render_the_brief(cards, predictions_data, action_data):
     try:
         if not cards:
             return ""
-        top = sorted(cards, key=lambda c: c.get("heat_score", 0), reverse=True)[:8]
-        headlines = ""
-        for card in top:
-            idx = cards.index(card)
+        # Carry each card's position through the sort instead of looking it
+        # up again with cards.index() (a linear scan with dict compares)
+        top = sorted(enumerate(cards), key=lambda ic: ic[1].get("heat_score", 0), reverse=True)[:8]
+        headlines = []
+        for idx, card in top:
             mode = card.get("card_mode", "straight_news")
             contested = '<span class="qs-contested-tag">CONTESTED</span>' if mode == "contested" else ""
             why_today = _esc(_get_why_today(card))
-            why_today_html = '<div class="brief-why">{}</div>'.format(why_today) if why_today else ""
-            headlines += '<a class="brief-item" href="#topic-card-{idx}"><div class="brief-head">{title}</div>{contested}{why}</a>'.format(
+            why_today_html = BRIEF_WHY_TEMPLATE.format(why_today) if why_today else ""
+            headlines.append(BRIEF_ITEM_TEMPLATE.format(
                 idx=idx,
                 title=_esc(card.get("title", "")),
                 contested=contested,
                 why=why_today_html,
-            )
+            ))
 
         actions = _normalize_action_data(action_data)
-        action_html = ""
+        action_cols = []
         for bucket, label in [("watch", "Watch"), ("prepare", "Prepare"), ("ignore", "Ignore")]:
-            items = ""
+            items = []
             for item in actions.get(bucket, [])[:2]:
                 txt = _esc(item.get("action", ""))
                 idx = item.get("card_index", 0)
                 if txt:
-                    items += '<a href="#topic-card-{idx}" class="brief-action-item">{txt}</a>'.format(idx=idx, txt=txt)
+                    items.append(BRIEF_ACTION_TEMPLATE.format(idx=idx, txt=txt))
             if items:
-                action_html += '<div class="brief-action-col"><div class="brief-action-label">{}</div>{}</div>'.format(label, items)
+                action_cols.append(BRIEF_ACTION_COL_TEMPLATE.format(label, "".join(items)))
 
         pred_html = _render_predictions(predictions_data)
-        return '<section class="the-brief"><h2>The Brief</h2><div class="brief-grid">{}</div><div class="brief-actions">{}</div>{}</section>'.format(
-            headlines,
-            action_html,
+        return BRIEF_TEMPLATE.format(
+            "".join(headlines),
+            "".join(action_cols),
             pred_html,
         )
     except Exception:
@@ -159,7 +214,8 @@ def _render_featured_editorial(cards):
             if editorial:
                 writer = _esc(card.get("editorial_writer", ""))
                 editor = _esc(card.get("editorial_editor", ""))
-                body = "".join("<p>{}</p>".format(_esc(p.strip())) for p in editorial.split("\n\n") if p.strip())
+                # escape the whole essay once, then split; escaping leaves newlines alone
+                body = "".join("<p>{}</p>".format(p.strip()) for p in _esc(editorial).split("\n\n") if p.strip())
                 meta = "{} · {}".format(writer, editor).strip(" ·")
                 return '<section class="featured-editorial"><h2>Featured Editorial</h2><a href="#topic-card-{idx}" class="featured-title">{title}</a><div class="editorial-meta">{meta}</div><div class="editorial-body">{body}</div></section>'.format(
                     idx=idx, title=_esc(card.get("title", "")), meta=meta, body=body
@@ -169,12 +225,55 @@ def _render_featured_editorial(cards):
         return ""
 
 
+# Markup for one story card, kept apart from the rendering logic below
+CARD_TEMPLATE = (
+    '<article class="story-card" id="topic-card-{idx}" data-topics="{topics}">'
+    '<div class="topic-tags">{tags}</div>'
+    '<h2 class="story-title">{title}</h2>'
+    '<div class="card-tldr"><strong>{tldr}</strong></div>'
+    '<div class="why-today">{why_today}</div>'
+    '<div class="story-meta"><span>{count} sources</span></div>'
+    '{details}</article>'
+)
+
+CARD_DETAILS_TEMPLATE = (
+    '<details class="card-expand"><summary class="card-expand-summary">Go Deeper</summary>'
+    '{spin}{unknown}{bigger}{facts}'
+    '<div class="card-section"><div class="section-label">Sources & Evidence</div>'
+    '<div class="source-pills">{sources}</div></div></details>'
+)
+
+# Fixed-shape fragments repeated inside a card
+SPIN_POSITION_TEMPLATE = '<div class="spin-position"><div>{}</div><div class="muted">{} · {}</div></div>'
+SPIN_WATCH_TEMPLATE = '<div class="spin-watch">{}</div>'
+UNKNOWN_QA_TEMPLATE = '<details class="unknown-qa"><summary>{}</summary><div>{}</div></details>'
+FACT_TEMPLATE = '<li>{}</li>'
+SOURCE_LINK_TEMPLATE = '<a href="{}" target="_blank" rel="noopener">{}</a>'
+SOURCE_PILL_TEMPLATE = '<span class="source-pill">{}{}'
+SOURCE_PILL_TAIL_TEMPLATE = ' <span class="muted">{}</span></span>'
+
+
+@lru_cache(maxsize=256)
+def _source_pill_tail(perspective):
+    """Closing half of a source pill. The same few perspective labels recur
+    on every card, so each is escaped and formatted once."""
+    return SOURCE_PILL_TAIL_TEMPLATE.format(_esc(perspective))
+
+
+# TOPICS flattened to (id, icon, name) rows for the import-time builders below
+_TOPICS_TABLE = tuple((tid, info["icon"], info["name"]) for tid, info in TOPICS.items())
+
+# TOPICS is static, so each tag is rendered once at import
+_TOPIC_TAG_HTML = {
+    tid: '<span class="topic-tag" data-topic="{}">{} {}</span>'.format(tid, icon, name)
+    for tid, icon, name in _TOPICS_TABLE
+}
+
+
 def _render_card(card, card_index=0):
     try:
-        topic_tags = ""
-        for t in card.get("topics", [])[:3]:
-            if t in TOPICS:
-                topic_tags += '<span class="topic-tag" data-topic="{}">{} {}</span>'.format(t, TOPICS[t]["icon"], TOPICS[t]["name"])
+        topic_tags = "".join(
+            _TOPIC_TAG_HTML[t] for t in card.get("topics", [])[:3] if t in _TOPIC_TAG_HTML)
 
         tldr_source = card.get("why_matters", card.get("so_what", ""))
         tldr = ""
@@ -191,27 +290,27 @@ def _render_card(card, card_index=0):
         if card.get("card_mode") == "contested":
             positions = card.get("spin_positions", [])
             preds = card.get("spin_predictions", [])
-            items = ""
+            items = []
             for p in positions[:3]:
                 if isinstance(p, dict):
-                    items += '<div class="spin-position"><div>{}</div><div class="muted">{} · {}</div></div>'.format(_esc(p.get("position", "")), _esc(p.get("who", "")), _esc(p.get("verified", "")))
+                    items.append(SPIN_POSITION_TEMPLATE.format(_esc(p.get("position", "")), _esc(p.get("who", "")), _esc(p.get("verified", ""))))
             for p in preds[:2]:
                 if isinstance(p, dict):
-                    items += '<div class="spin-watch">{}</div>'.format(_esc(p.get("prediction", "")))
+                    items.append(SPIN_WATCH_TEMPLATE.format(_esc(p.get("prediction", ""))))
             if items:
-                spin_html = '<div class="card-section"><div class="section-label">How Sources Frame This</div>{}</div>'.format(items)
+                spin_html = '<div class="card-section"><div class="section-label">How Sources Frame This</div>{}</div>'.format("".join(items))
 
         unknown_html = ""
         if _has_substantive_unknowns(card):
-            qas = ""
+            qas = []
             for u in card.get("unknowns", card.get("key_unknowns", []))[:3]:
                 if isinstance(u, dict):
                     q = _esc(u.get("q", u.get("question", "")))
                     a = _esc(u.get("a", u.get("answer", "Not yet reported.")))
                     if q:
-                        qas += '<details class="unknown-qa"><summary>{}</summary><div>{}</div></details>'.format(q, a)
+                        qas.append(UNKNOWN_QA_TEMPLATE.format(q, a))
             if qas:
-                unknown_html = '<div class="card-section"><div class="section-label">Decision Blockers</div>{}</div>'.format(qas)
+                unknown_html = '<div class="card-section"><div class="section-label">Decision Blockers</div>{}</div>'.format("".join(qas))
 
         bigger_html = ""
         bigger = card.get("bigger_picture", "")
@@ -221,27 +320,28 @@ def _render_card(card, card_index=0):
         facts_html = ""
         facts = card.get("key_facts", [])
         if isinstance(facts, list) and facts:
-            items = "".join('<li>{}</li>'.format(_esc(f)) for f in facts[:5] if isinstance(f, str) and f.strip())
+            items = "".join(FACT_TEMPLATE.format(_esc(f)) for f in facts[:5] if isinstance(f, str) and f.strip())
             if items:
                 facts_html = '<div class="card-section"><div class="section-label">Sources & Evidence</div><ul>{}</ul></div>'.format(items)
 
-        sources_html = ""
+        source_pills = []
         for s in card.get("sources", []):
             if isinstance(s, dict):
                 nm = _esc(s.get("name", ""))
                 url = s.get("url", "")
-                nm = '<a href="{}" target="_blank" rel="noopener">{}</a>'.format(url, nm) if url else nm
-                sources_html += '<span class="source-pill">{} <span class="muted">{}</span></span>'.format(nm, _esc(s.get("perspective", "")))
+                nm = SOURCE_LINK_TEMPLATE.format(_esc(url), nm) if url else nm
+                source_pills.append(SOURCE_PILL_TEMPLATE.format(nm, _source_pill_tail(s.get("perspective", ""))))
+        sources_html = "".join(source_pills)
 
         details = ""
         if spin_html or unknown_html or bigger_html or facts_html or sources_html:
-            details = '<details class="card-expand"><summary class="card-expand-summary">Go Deeper</summary>{spin}{unknown}{bigger}{facts}<div class="card-section"><div class="section-label">Sources & Evidence</div><div class="source-pills">{sources}</div></div></details>'.format(
+            details = CARD_DETAILS_TEMPLATE.format(
                 spin=spin_html, unknown=unknown_html, bigger=bigger_html, facts=facts_html, sources=sources_html
             )
 
-        return '<article class="story-card" id="topic-card-{idx}" data-topics="{topics}"><div class="topic-tags">{tags}</div><h2 class="story-title">{title}</h2><div class="card-tldr"><strong>{tldr}</strong></div><div class="why-today">{why_today}</div><div class="story-meta"><span>{count} sources</span></div>{details}</article>'.format(
+        return CARD_TEMPLATE.format(
             idx=card_index,
-            topics=" ".join(card.get("topics", [])[:3]),
+            topics=_esc(" ".join(card.get("topics", [])[:3])),
             tags=topic_tags,
             title=_esc(card.get("title", "")),
             tldr=_esc(tldr),
@@ -272,14 +372,15 @@ def _render_synthesis(synthesis):
         return ""
 
 
+# The filter bar only depends on TOPICS, so it is built once at import
+_FILTER_BUTTONS_HTML = '<button class="filter-btn active" data-filter="all">All</button>' + "".join(
+    '<button class="filter-btn" data-filter="{}">{} {}</button>'.format(tid, icon, name)
+    for tid, icon, name in _TOPICS_TABLE
+)
+
+
 def _render_filters():
-    try:
-        html = '<button class="filter-btn active" data-filter="all">All</button>'
-        for tid, info in TOPICS.items():
-            html += '<button class="filter-btn" data-filter="{}">{} {}</button>'.format(tid, info["icon"], info["name"])
-        return html
-    except Exception:
-        return ""
+    return _FILTER_BUTTONS_HTML
 
 
 def _render_action_layer(actions):
@@ -301,23 +402,21 @@ def _render_predictions(data):
             ("near_term", "Next 48 Hours"),
             ("medium_term", "This Week / This Month"),
         ]
-        blocks = ""
+        blocks = []
         for key, label in categories:
-            items = ""
+            items = []
             for p in data.get(key, [])[:3]:
                 if not isinstance(p, dict):
                     continue
                 signal = p.get("disconfirming_signal") or p.get("disconfirm")
                 if not signal:
                     continue
-                items += '<div class="pred-item"><div class="pred-text">{}</div><div class="pred-disconfirm">Would be wrong if: {}</div></div>'.format(
-                    _esc(p.get("prediction", "")), _esc(signal)
-                )
+                items.append(PREDICTION_TEMPLATE.format(_esc(p.get("prediction", "")), _esc(signal)))
             if items:
-                blocks += '<div class="pred-category"><div class="pred-category-label">{}</div>{}</div>'.format(label, items)
+                blocks.append(PREDICTION_CATEGORY_TEMPLATE.format(label, "".join(items)))
         if not blocks:
             return ""
-        return '<div class="predictions-box">{}</div>'.format(blocks)
+        return '<div class="predictions-box">{}</div>'.format("".join(blocks))
     except Exception:
         return ""
 
@@ -347,110 +446,118 @@ def _render_review_panel(quality_review):
         return ""
 
 
-HTML_TEMPLATE = """<!DOCTYPE html>
-<html lang=\"en\">
+# Static page shell: CSS head and JS tail are plain constants, so only the
+# short body templates around the story cards go through str.format per render.
+PAGE_HEAD = """<!DOCTYPE html>
+<html lang="en">
 <head>
-<meta charset=\"UTF-8\"><meta name=\"viewport\" content=\"width=device-width, initial-scale=1.0\">
+<meta charset="UTF-8"><meta name="viewport" content="width=device-width, initial-scale=1.0">
 <title>Global Intelligence Briefing</title>
 <style>
-:root {{--bg:#0a0e17;--card-bg:#111827;--border:#1e293b;--text:#e2e8f0;--muted:#94a3b8;--accent:#f59e0b;--purple:#a78bfa;}}
-* {{box-sizing:border-box}} body {{font-family:Arial,sans-serif;background:var(--bg);color:var(--text);line-height:1.6;padding:0 1rem;max-width:900px;margin:0 auto;}}
-.masthead {{text-align:center;padding:1.5rem 0 1rem;border-bottom:1px solid var(--border);margin-bottom:1rem;}}
-.mode-toggle {{display:inline-flex;gap:.4rem;margin-top:.8rem}} .mode-btn {{background:var(--card-bg);color:var(--muted);border:1px solid var(--border);border-radius:999px;padding:.28rem .8rem;cursor:pointer}} .mode-btn.active {{background:var(--accent);color:#000}}
-.the-brief {{background:var(--card-bg);border:1px solid var(--border);border-radius:10px;padding:1rem;margin:1rem 0 1.2rem;}}
-.brief-grid {{display:grid;grid-template-columns:1fr 1fr;gap:.5rem;}} .brief-item {{display:block;padding:.5rem;border:1px solid var(--border);border-radius:6px;color:var(--text);text-decoration:none}} .brief-head {{font-size:.9rem;font-weight:600}} .brief-why {{font-size:.78rem;color:var(--muted)}}
-.brief-actions {{display:grid;grid-template-columns:repeat(3,1fr);gap:.6rem;margin-top:.8rem}} .brief-action-label {{font-size:.72rem;color:var(--accent);text-transform:uppercase}} .brief-action-item {{display:block;font-size:.83rem;color:var(--text);text-decoration:none;margin:.2rem 0}}
-.featured-editorial {{background:var(--card-bg);border-left:3px solid var(--purple);border-radius:8px;padding:1rem;margin-bottom:1rem}}
-.filter-bar {{display:flex;flex-wrap:wrap;gap:.4rem;margin:1rem 0}} .filter-btn {{background:var(--card-bg);color:var(--muted);border:1px solid var(--border);padding:.3rem .7rem;border-radius:999px;cursor:pointer}} .filter-btn.active {{background:var(--accent);color:#000}}
-.heatmap-btn {{font-size:.75rem;padding:.3rem .7rem;background:transparent;border:1px solid var(--purple);color:var(--purple);border-radius:4px;cursor:pointer}} .heatmap-btn.active {{background:var(--purple);color:#000}}
-.story-card {{background:var(--card-bg);border:1px solid var(--border);border-radius:10px;padding:1rem;margin-bottom:.8rem}}
-.story-title {{font-size:1.1rem;margin:.2rem 0}} .card-tldr {{margin:.25rem 0 .2rem}} .why-today {{color:var(--muted);font-size:.85rem;margin-bottom:.2rem}}
-.topic-tag {{display:inline-block;font-size:.7rem;background:#1e293b;padding:.15rem .45rem;border-radius:999px;margin-right:.25rem}}
-.story-meta {{font-size:.75rem;color:var(--muted)}}
-.card-expand {{margin-top:.4rem}} .card-expand-summary {{cursor:pointer;color:var(--purple);font-size:.82rem;font-weight:600}}
-.card-section {{margin-top:.6rem;padding:.55rem;background:#0f172a;border-radius:6px}} .section-label {{font-size:.72rem;text-transform:uppercase;color:var(--accent);margin-bottom:.3rem}}
-.source-pill {{display:inline-block;margin:.2rem .3rem .2rem 0;padding:.2rem .5rem;border:1px solid var(--border);border-radius:999px;font-size:.74rem}} .muted {{color:var(--muted)}}
-.pred-category-label {{font-size:.72rem;color:var(--purple);text-transform:uppercase}} .pred-item {{margin:.3rem 0}} .pred-disconfirm {{font-size:.75rem;color:var(--muted)}}
-.run-report {{margin:1.3rem 0;padding:.8rem;background:var(--card-bg);border:1px solid var(--border);border-radius:8px;font-size:.75rem;color:var(--muted);text-align:center}}
-.analyst-only {{}} .mode-brief .analyst-only {{display:none!important}} .mode-analyst .analyst-only {{display:initial}}
-.qs-contested-tag {{font-size:.66rem;color:#fca5a5}}
-@media (max-width:700px) {{ .brief-grid,.brief-actions {{grid-template-columns:1fr}} }}
+:root {--bg:#0a0e17;--card-bg:#111827;--border:#1e293b;--text:#e2e8f0;--muted:#94a3b8;--accent:#f59e0b;--purple:#a78bfa;}
+* {box-sizing:border-box} body {font-family:Arial,sans-serif;background:var(--bg);color:var(--text);line-height:1.6;padding:0 1rem;max-width:900px;margin:0 auto;}
+.masthead {text-align:center;padding:1.5rem 0 1rem;border-bottom:1px solid var(--border);margin-bottom:1rem;}
+.mode-toggle {display:inline-flex;gap:.4rem;margin-top:.8rem} .mode-btn {background:var(--card-bg);color:var(--muted);border:1px solid var(--border);border-radius:999px;padding:.28rem .8rem;cursor:pointer} .mode-btn.active {background:var(--accent);color:#000}
+.the-brief {background:var(--card-bg);border:1px solid var(--border);border-radius:10px;padding:1rem;margin:1rem 0 1.2rem;}
+.brief-grid {display:grid;grid-template-columns:1fr 1fr;gap:.5rem;} .brief-item {display:block;padding:.5rem;border:1px solid var(--border);border-radius:6px;color:var(--text);text-decoration:none} .brief-head {font-size:.9rem;font-weight:600} .brief-why {font-size:.78rem;color:var(--muted)}
+.brief-actions {display:grid;grid-template-columns:repeat(3,1fr);gap:.6rem;margin-top:.8rem} .brief-action-label {font-size:.72rem;color:var(--accent);text-transform:uppercase} .brief-action-item {display:block;font-size:.83rem;color:var(--text);text-decoration:none;margin:.2rem 0}
+.featured-editorial {background:var(--card-bg);border-left:3px solid var(--purple);border-radius:8px;padding:1rem;margin-bottom:1rem}
+.filter-bar {display:flex;flex-wrap:wrap;gap:.4rem;margin:1rem 0} .filter-btn {background:var(--card-bg);color:var(--muted);border:1px solid var(--border);padding:.3rem .7rem;border-radius:999px;cursor:pointer} .filter-btn.active {background:var(--accent);color:#000}
+.heatmap-btn {font-size:.75rem;padding:.3rem .7rem;background:transparent;border:1px solid var(--purple);color:var(--purple);border-radius:4px;cursor:pointer} .heatmap-btn.active {background:var(--purple);color:#000}
+.story-card {background:var(--card-bg);border:1px solid var(--border);border-radius:10px;padding:1rem;margin-bottom:.8rem}
+.story-title {font-size:1.1rem;margin:.2rem 0} .card-tldr {margin:.25rem 0 .2rem} .why-today {color:var(--muted);font-size:.85rem;margin-bottom:.2rem}
+.topic-tag {display:inline-block;font-size:.7rem;background:#1e293b;padding:.15rem .45rem;border-radius:999px;margin-right:.25rem}
+.story-meta {font-size:.75rem;color:var(--muted)}
+.card-expand {margin-top:.4rem} .card-expand-summary {cursor:pointer;color:var(--purple);font-size:.82rem;font-weight:600}
+.card-section {margin-top:.6rem;padding:.55rem;background:#0f172a;border-radius:6px} .section-label {font-size:.72rem;text-transform:uppercase;color:var(--accent);margin-bottom:.3rem}
+.source-pill {display:inline-block;margin:.2rem .3rem .2rem 0;padding:.2rem .5rem;border:1px solid var(--border);border-radius:999px;font-size:.74rem} .muted {color:var(--muted)}
+.pred-category-label {font-size:.72rem;color:var(--purple);text-transform:uppercase} .pred-item {margin:.3rem 0} .pred-disconfirm {font-size:.75rem;color:var(--muted)}
+.run-report {margin:1.3rem 0;padding:.8rem;background:var(--card-bg);border:1px solid var(--border);border-radius:8px;font-size:.75rem;color:var(--muted);text-align:center}
+.analyst-only {} .mode-brief .analyst-only {display:none!important} .mode-analyst .analyst-only {display:initial}
+.qs-contested-tag {font-size:.66rem;color:#fca5a5}
+@media (max-width:700px) { .brief-grid,.brief-actions {grid-template-columns:1fr} }
 </style>
 </head>
-<body class=\"mode-brief\">
-<div class=\"masthead\"><h1>Global Intelligence Briefing</h1><div class=\"meta\">{date} | {num_stories} stories | Models: {llms}</div><div class=\"meta\" style=\"font-size:.75rem\">Updated every 2 hours · Runtime: {runtime}s</div><div class=\"mode-toggle\" role=\"group\" aria-label=\"View mode\"><button class=\"mode-btn active\" id=\"mode-brief-btn\" type=\"button\">Morning Brief</button><button class=\"mode-btn\" id=\"mode-analyst-btn\" type=\"button\">Analyst View</button></div></div>
+<body class="mode-brief">
+"""
+
+PAGE_BODY_TOP = """<div class="masthead"><h1>Global Intelligence Briefing</h1><div class="meta">{date} | {num_stories} stories | Models: {llms}</div><div class="meta" style="font-size:.75rem">Updated every 2 hours · Runtime: {runtime}s</div><div class="mode-toggle" role="group" aria-label="View mode"><button class="mode-btn active" id="mode-brief-btn" type="button">Morning Brief</button><button class="mode-btn" id="mode-analyst-btn" type="button">Analyst View</button></div></div>
 {the_brief}
 {featured_editorial}
-<details class=\"synthesis-expand\"><summary class=\"synthesis-toggle\">Executive Synthesis (full analysis)</summary><div class=\"synthesis-box\"><h2>Executive Synthesis</h2>{synthesis}</div></details>
-<div class=\"filter-bar\">{filters}<button class=\"heatmap-btn\" id=\"heatmap-toggle\" title=\"Highlight uncertain claims\">🔍 Uncertainty</button></div>
-{stories}
-<div class=\"run-report\">{run_report}</div>
+<details class="synthesis-expand"><summary class="synthesis-toggle">Executive Synthesis (full analysis)</summary><div class="synthesis-box"><h2>Executive Synthesis</h2>{synthesis}</div></details>
+<div class="filter-bar">{filters}<button class="heatmap-btn" id="heatmap-toggle" title="Highlight uncertain claims">🔍 Uncertainty</button></div>
+"""
+
+PAGE_BODY_BOTTOM = """
+<div class="run-report">{run_report}</div>
 {review_panel}
-<script>
+"""
+
+PAGE_TAIL = """<script>
 const params = new URLSearchParams(window.location.search);
 const initialFilter = params.get('filter') || 'all';
-document.querySelectorAll('.filter-btn').forEach(btn => {{
-    btn.addEventListener('click', () => {{
+document.querySelectorAll('.filter-btn').forEach(btn => {
+    btn.addEventListener('click', () => {
         document.querySelectorAll('.filter-btn').forEach(b => b.classList.remove('active'));
         btn.classList.add('active');
         const f = btn.dataset.filter;
-        document.querySelectorAll('.story-card').forEach(c => {{
+        document.querySelectorAll('.story-card').forEach(c => {
             c.style.display = (f === 'all' || c.dataset.topics.split(' ').includes(f)) ? '' : 'none';
-        }});
+        });
         const url = new URL(window.location);
-        if (f === 'all') {{ url.searchParams.delete('filter'); }}
-        else {{ url.searchParams.set('filter', f); }}
+        if (f === 'all') { url.searchParams.delete('filter'); }
+        else { url.searchParams.set('filter', f); }
         history.replaceState(null, '', url);
-    }});
-    if (btn.dataset.filter === initialFilter) {{ btn.click(); }}
-}});
-document.getElementById('heatmap-toggle').addEventListener('click', function() {{
+    });
+    if (btn.dataset.filter === initialFilter) { btn.click(); }
+});
+document.getElementById('heatmap-toggle').addEventListener('click', function() {
     document.body.classList.toggle('heatmap-mode');
     this.classList.toggle('active');
-    if (document.body.classList.contains('heatmap-mode')) {{
+    if (document.body.classList.contains('heatmap-mode')) {
         document.querySelectorAll('.card-expand').forEach(d => d.open = true);
-    }}
-}});
-if (window.location.hash) {{
+    }
+});
+if (window.location.hash) {
     const target = document.querySelector(window.location.hash);
-    if (target) {{
+    if (target) {
         const expand = target.querySelector('.card-expand');
         if (expand) expand.open = true;
-        setTimeout(() => target.scrollIntoView({{behavior: 'smooth'}}), 100);
-    }}
-}}
-document.querySelectorAll('a[href^="#topic-card"]').forEach(a => {{
-    a.addEventListener('click', () => {{
+        setTimeout(() => target.scrollIntoView({behavior: 'smooth'}), 100);
+    }
+}
+document.querySelectorAll('a[href^="#topic-card"]').forEach(a => {
+    a.addEventListener('click', () => {
         const hash = a.getAttribute('href').replace(/.*#/, '#');
         const target = document.querySelector(hash);
-        if (target) {{
+        if (target) {
             const expand = target.querySelector('.card-expand');
             if (expand) expand.open = true;
-        }}
-    }});
-}});
-(function () {{
+        }
+    });
+});
+(function () {
     const briefBtn = document.getElementById('mode-brief-btn');
     const analystBtn = document.getElementById('mode-analyst-btn');
     if (!briefBtn || !analystBtn) return;
-    function applyMode(mode) {{
-        if (mode === 'analyst') {{
+    function applyMode(mode) {
+        if (mode === 'analyst') {
             document.body.classList.remove('mode-brief');
             document.body.classList.add('mode-analyst');
             briefBtn.classList.remove('active');
             analystBtn.classList.add('active');
-        }} else {{
+        } else {
             document.body.classList.remove('mode-analyst');
             document.body.classList.add('mode-brief');
             analystBtn.classList.remove('active');
             briefBtn.classList.add('active');
-        }}
-    }}
-    briefBtn.addEventListener('click', function() {{ applyMode('brief'); try {{ localStorage.setItem('gib-view-mode', 'brief'); }} catch (e) {{}} }});
-    analystBtn.addEventListener('click', function() {{ applyMode('analyst'); try {{ localStorage.setItem('gib-view-mode', 'analyst'); }} catch (e) {{}} }});
+        }
+    }
+    briefBtn.addEventListener('click', function() { applyMode('brief'); try { localStorage.setItem('gib-view-mode', 'brief'); } catch (e) {} });
+    analystBtn.addEventListener('click', function() { applyMode('analyst'); try { localStorage.setItem('gib-view-mode', 'analyst'); } catch (e) {} });
     let savedMode = 'brief';
-    try {{ const storedMode = localStorage.getItem('gib-view-mode'); if (storedMode === 'brief' || storedMode === 'analyst') savedMode = storedMode; }} catch (e) {{}}
+    try { const storedMode = localStorage.getItem('gib-view-mode'); if (storedMode === 'brief' || storedMode === 'analyst') savedMode = storedMode; } catch (e) {}
     applyMode(savedMode);
-}})();
+})();
 </script>
 </body></html>"""
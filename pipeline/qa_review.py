@@ -13,7 +13,6 @@ Cards receive qa_warnings list — publish renders them if present.
 """
 
 import json
-import re
 
 import llm as llm_caller
 from models import StepReport
@@ -88,10 +87,7 @@ Each warning: {{"type": "contradiction|overclaiming|unsupported_spin|factual_err
             continue
 
         try:
-            cleaned = re.sub(r'```json\s*', '', result)
-            cleaned = re.sub(r'```\s*', '', cleaned).strip()
-            m = re.search(r'\[.*\]', cleaned, re.DOTALL)
-            warnings = json.loads(m.group() if m else cleaned)
+            warnings = llm_caller.parse_json(result, array=True)
             report.llm_successes += 1
 
             if warnings and isinstance(warnings, list):
@@ -3,9 +3,6 @@ Quickscan: "Today in 60 Seconds" — scannable overview.
 Each story gets: headline, one-liner summary, and why-it-matters.
 """
 
-import json
-import re
-
 import llm as llm_caller
 from config import TOPICS
 from models import StepReport
@@ -80,15 +77,15 @@ CRITICAL RULES:
         report.llm_failures += 1
         qs = _fallback(ranked)
 
-    # Map quickscan stories to actual cards by matching headlines
+    # Map quickscan stories to actual cards by matching headlines.
+    # Card titles are tokenized once here, not once per quickscan story.
+    card_word_sets = [(card, set(card.title.lower().split())) for card in ranked[:15]]
     for s in qs.get("top_stories", []):
-        qs_headline = s.get("headline", "").lower().strip()
+        qs_words = set(s.get("headline", "").lower().split())
         best_match = None
         best_score = 0
-        for card in ranked[:15]:
+        for card, card_words in card_word_sets:
             # Compare by word overlap between quickscan headline and card title
-            card_words = set(card.title.lower().split())
-            qs_words = set(qs_headline.split())
             if not card_words or not qs_words:
                 continue
             overlap = len(card_words & qs_words) / max(len(card_words | qs_words), 1)
@@ -123,10 +120,7 @@ CRITICAL RULES:
 
 def _parse(result):
     try:
-        cleaned = re.sub(r'```json\s*', '', result)
-        cleaned = re.sub(r'```\s*', '', cleaned).strip()
-        m = re.search(r'\{.*\}', cleaned, re.DOTALL)
-        data = json.loads(m.group() if m else cleaned)
+        data = llm_caller.parse_json(result)
         for key in ["top_stories", "key_tensions", "watch_list"]:
             if key not in data:
                 data[key] = []
@@ -5,25 +5,26 @@ Diversity is a soft nudge on ordering, not a hard gate.
 Stories below materiality threshold are dropped.
 """
 
+import heapq
 import json
-import re
-import time
 
 import llm as llm_caller
 from config import LLM_CONFIGS, TOPICS, MATERIALITY_CUTOFF, MAX_STORIES
 from models import RankedStory, StepReport
 
+MAX_CANDIDATES = 50
+
 
 def run(clusters, topics):
     """Select and rank stories. Returns (ranked_stories, report)."""
-    # Only consider clusters worth evaluating (2+ articles or high relevance)
-    candidates = []
-    for c in clusters:
-        if c.size >= 2 or (c.lead and c.lead.relevance_score >= 0.6):
-            candidates.append(c)
-
-    candidates.sort(key=lambda c: c.size, reverse=True)
-    candidates = candidates[:50]  # Cap for LLM prompt size
+    # Only consider clusters worth evaluating (2+ articles or high relevance),
+    # largest first, capped for LLM prompt size. nlargest is a bounded heap
+    # (same order as a stable sort + slice) instead of sorting every cluster.
+    candidates = heapq.nlargest(
+        MAX_CANDIDATES,
+        (c for c in clusters
+         if c.size >= 2 or (c.lead and c.lead.relevance_score >= 0.6)),
+        key=lambda c: c.size)
 
     print("\n>>> SELECT: rating {} candidates...".format(len(candidates)))
     report = StepReport("select", items_in=len(candidates))
@@ -74,23 +75,19 @@ Return ONLY a JSON array, one entry per story:
     available_voters = [k for k in llm_caller.get_available_llms() if k != "gemini_pro"][:3]
     print("    Voters: {}".format(", ".join(LLM_CONFIGS[k]["label"] for k in available_voters)))
 
-    for llm_id in available_voters:
+    # Voters are independent calls to different providers, so they run at once
+    system = "You rate news importance. Return only JSON array."
+    results = llm_caller.call_many([(llm_id, system, prompt, 3000) for llm_id in available_voters])
+    for llm_id, result in zip(available_voters, results):
         config = LLM_CONFIGS[llm_id]
         report.llm_calls += 1
-        print("    {} rating...".format(config["label"]))
-        result = llm_caller.call_by_id(llm_id,
-            "You rate news importance. Return only JSON array.", prompt, 3000)
-        time.sleep(1)
 
         if not result:
             report.llm_failures += 1
             continue
 
         try:
-            cleaned = re.sub(r'```json\s*', '', result)
-            cleaned = re.sub(r'```\s*', '', cleaned).strip()
-            m = re.search(r'\[.*\]', cleaned, re.DOTALL)
-            ratings = json.loads(m.group() if m else cleaned)
+            ratings = llm_caller.parse_json(result, array=True)
             report.llm_successes += 1
             voters += 1
 
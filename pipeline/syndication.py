@@ -10,7 +10,9 @@ This prevents inflated source counts from creating false consensus.
 No LLM calls — purely mechanical similarity detection.
 """
 
+import re
 from collections import defaultdict
+
 from models import StepReport
 
 
@@ -29,17 +31,17 @@ WIRE_SIGNALS = [
     "(AP)", "(Reuters)", "(AFP)", "— AP", "— Reuters",
     "— AFP", "(PA)", "Associated Press", "Reuters reported",
 ]
+# Lowered once here rather than per article
+_WIRE_SIGNALS_LOWER = [(signal, signal.lower()) for signal in WIRE_SIGNALS]
+
+_PUNCT = re.compile(r'[^\w\s]')
 
 
 def _normalize_text(text):
     """Normalize text for comparison: lowercase, strip punctuation."""
     if not text:
         return ""
-    import re
-    text = text.lower()
-    text = re.sub(r'[^\w\s]', '', text)
-    text = re.sub(r'\s+', ' ', text).strip()
-    return text
+    return " ".join(_PUNCT.sub('', text.lower()).split())
 
 
 def _word_set(text):
@@ -71,8 +73,9 @@ def run(articles):
             continue
 
         # Check for wire signals in summary text
-        for signal in WIRE_SIGNALS:
-            if signal.lower() in (article.summary or "").lower():
+        summary_lower = (article.summary or "").lower()
+        for signal, signal_lower in _WIRE_SIGNALS_LOWER:
+            if signal_lower in summary_lower:
                 article.wire_origin = signal.strip("()— ").split(" ")[0]
                 article.is_independent = False
                 break
@@ -84,7 +87,13 @@ def run(articles):
         combined = (article.title + " " + article.summary[:200])
         text_features.append(_word_set(combined))
 
-    # Find groups of near-identical articles (Jaccard > 0.7)
+    # Find groups of near-identical articles (Jaccard > 0.7). Pairs with no
+    # word in common score 0, so only pairs found via the word index are scored.
+    index = defaultdict(set)
+    for i, words in enumerate(text_features):
+        for w in words:
+            index[w].add(i)
+
     syndication_groups = []
     assigned = set()
 
@@ -92,9 +101,17 @@ def run(articles):
         if i in assigned:
             continue
         group = [i]
-        for j in range(i + 1, len(articles)):
+        candidates = set()
+        for w in text_features[i]:
+            candidates |= index[w]
+        size_i = len(text_features[i])
+        for j in sorted(c for c in candidates if c > i):
             if j in assigned:
                 continue
+            # Jaccard <= min/max of the set sizes, so lopsided pairs can't pass
+            size_j = len(text_features[j])
+            if min(size_i, size_j) <= 0.7 * max(size_i, size_j):
+                continue
             sim = _jaccard(text_features[i], text_features[j])
             if sim > 0.7:
                 group.append(j)
@@ -133,7 +150,7 @@ def run(articles):
 
     # Count results
     independent = sum(1 for a in articles if a.is_independent)
-    republished = sum(1 for a in articles if not a.is_independent)
+    republished = len(articles) - independent
 
     report.items_out = len(articles)
     report.notes.append("{} independent, {} republished, {} syndication groups".format(
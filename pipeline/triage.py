@@ -5,8 +5,6 @@ Batch size ~20 articles per call for cost efficiency.
 """
 
 import json
-import re
-import time
 
 import llm as llm_caller
 from config import TOPICS
@@ -29,7 +27,6 @@ def run(articles, topics):
     for batch_start in range(0, len(articles), BATCH_SIZE):
         batch = articles[batch_start:batch_start + BATCH_SIZE]
         _classify_batch(batch, topic_list, report)
-        time.sleep(0.5)
 
     # Filter: keep articles with at least one topic and relevance > 0
     relevant = [a for a in articles if a.topics and a.relevance_score > 0]
@@ -45,7 +42,7 @@ def _classify_batch(batch, topic_list, report):
     article_lines = []
     for i, a in enumerate(batch):
         article_lines.append("{}: [{}] {} — {}".format(
-            i, a.source_name, a.title, a.summary[:150]))
+            i, a.source_name, a.title, llm_caller.clip(a.summary, 150)))
 
     prompt = """Classify each article into one or more topics. Rate relevance 0-10.
 0 = not relevant to any topic. 10 = critically important.
@@ -75,7 +72,7 @@ Rules:
     report.llm_calls += 1
     result = llm_caller.call_by_id("gemini",
         "You classify news articles. Return only JSON. Be accurate.",
-        prompt, 2000)
+        prompt, 2000, json_mode=True)
 
     if not result:
         report.llm_failures += 1
@@ -86,10 +83,7 @@ Rules:
         return
 
     try:
-        cleaned = re.sub(r'```json\s*', '', result)
-        cleaned = re.sub(r'```\s*', '', cleaned).strip()
-        m = re.search(r'\[.*\]', cleaned, re.DOTALL)
-        classifications = json.loads(m.group() if m else cleaned)
+        classifications = llm_caller.parse_json(result, array=True)
         report.llm_successes += 1
 
         for entry in classifications:
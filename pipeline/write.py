@@ -17,7 +17,6 @@ Tiers control depth:
 
 import json
 import re
-import time
 
 import llm as llm_caller
 from config import LLM_CONFIGS
@@ -293,8 +292,7 @@ def _is_politically_significant(cluster):
 def _build_context(cluster, comparison):
     """Build shared context string for LLM calls."""
     sources_summary = "\n".join(
-        "- {} ({}, {})".format(a.source_name, a.source_region, a.source_bias)
-        for a in cluster.articles[:10])
+        "- " + a.source_label() for a in cluster.articles[:10])
 
     headlines = "\n".join(
         "- {}: {}".format(a.source_name, a.title[:100])
@@ -321,34 +319,25 @@ def _call(writer_id, context, instruction, output_type, report, max_tokens=1500)
     result = llm_caller.call_by_id(writer_id,
         "Intelligence analyst writing a briefing. Use ONLY provided facts. Return ONLY requested output. Every sentence ends with a period.",
         prompt, max_tokens)
-    time.sleep(0.5)
 
     if not result:
         report.llm_failures += 1
         return None
     report.llm_successes += 1
 
-    result = result.strip()
-    result = re.sub(r'```json\s*', '', result)
-    result = re.sub(r'```\s*', '', result).strip()
-
     if output_type == "text":
-        return result.strip('"').strip("'") or None
+        return llm_caller.strip_fences(result).strip('"').strip("'") or None
     elif output_type == "json_array":
         try:
-            m = re.search(r'\[.*\]', result, re.DOTALL)
-            if m:
-                parsed = json.loads(m.group())
-                return parsed if isinstance(parsed, list) else None
+            parsed = llm_caller.parse_json(result, array=True)
+            return parsed if isinstance(parsed, list) else None
         except (json.JSONDecodeError, ValueError):
             pass
         return None
     elif output_type == "json_object":
         try:
-            m = re.search(r'\{.*\}', result, re.DOTALL)
-            if m:
-                parsed = json.loads(m.group())
-                return parsed if isinstance(parsed, dict) else None
+            parsed = llm_caller.parse_json(result)
+            return parsed if isinstance(parsed, dict) else None
         except (json.JSONDecodeError, ValueError):
             pass
         return None
@@ -393,8 +382,13 @@ def _sanitize_card(card):
             ])
 
 
+_DISALLOWED_CHARS = re.compile(r'[^\x00-\x7F\u00C0-\u00FF\u2018-\u201D\u2013\u2014\u2026\u20AC\u00A3]+')
+_MULTI_SPACE = re.compile(r'  +')
+
+
 def _sanitize_text(text):
     if not isinstance(text, str):
         return text
-    cleaned = re.sub(r'[^\x00-\x7F\u00C0-\u00FF\u2018-\u201D\u2013\u2014\u2026\u20AC\u00A3]+', '', text)
-    return re.sub(r'  +', ' ', cleaned).strip()
+    # ASCII is always allowed, so only non-ASCII text needs the character filter
+    cleaned = text if text.isascii() else _DISALLOWED_CHARS.sub('', text)
+    return _MULTI_SPACE.sub(' ', cleaned).strip()
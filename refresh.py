@@ -15,6 +15,7 @@ Target: ~20-40 LLM calls vs 200-470 for full run.
 import json
 import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from config import get_active_sources, get_active_topics, load_query_pack, LLM_CONFIGS
@@ -26,15 +27,17 @@ from pipeline import (fetch, syndication, triage, cluster, select,
                       card_dedup, predictions, quickscan, action_layer,
                       validate, publish, synthesize)
 
+STORY_WORKERS = 3
+
 
 def _is_new_story(cluster_obj, existing_titles):
     """Check if a cluster represents a genuinely new story."""
     if not existing_titles:
         return True
 
-    lead_words = set(cluster_obj.lead_title.lower().split())
+    lead_words = card_store.title_words(cluster_obj.lead_title)
     for existing in existing_titles:
-        existing_words = set(existing.lower().split())
+        existing_words = card_store.title_words(existing)
         if len(lead_words) > 0 and len(existing_words) > 0:
             overlap = len(lead_words & existing_words) / min(len(lead_words), len(existing_words))
             if overlap > 0.4:
@@ -43,7 +46,7 @@ def _is_new_story(cluster_obj, existing_titles):
 
 
 def run_refresh(pack=None):
-    """Run lightweight refresh. Returns HTML string or None on failure."""
+    """Run lightweight refresh. Returns the index.html path or None on failure."""
     start_time = time.time()
     print("=" * 70)
     print("GLOBAL INTELLIGENCE BRIEFING v3 — REFRESH MODE")
@@ -104,32 +107,23 @@ def run_refresh(pack=None):
         existing_topic_cards = _reconstruct_cards(existing_cards)
         run_time = int(time.time() - start_time)
         card_store.save_run(existing_topic_cards, run_time, mode="refresh_no_change")
-        return _republish(existing_topic_cards, all_reports, run_time)
+        return _republish(existing_topic_cards, all_reports, run_time, available)
 
     # Step 4: Select only new clusters (quick — fewer items)
     ranked_new, select_report = select.run(new_clusters, topics)
     all_reports.append(select_report)
 
     # Process new stories (standard tier max to save costs in refresh)
+    # (a few in flight at once; results keep ranking order)
     new_cards = []
-    for i, ranked in enumerate(ranked_new[:5]):  # Cap at 5 new stories per refresh
-        try:
-            # Force standard tier max in refresh (no deep investigation)
-            if ranked.depth_tier == "deep":
-                ranked.depth_tier = "standard"
-
-            if ranked.depth_tier == "standard":
-                card, story_reports = _process_standard_quick(ranked, i + 1, len(ranked_new))
-            else:
-                card, story_reports = _process_brief(ranked, i + 1, len(ranked_new))
-
+    with ThreadPoolExecutor(max_workers=STORY_WORKERS) as pool:
+        futures = [pool.submit(_process_story, ranked, i + 1, len(ranked_new))
+                   for i, ranked in enumerate(ranked_new[:5])]  # Cap at 5 new stories per refresh
+        for f in futures:
+            card, story_reports = f.result()
             all_reports.extend(story_reports)
             if card:
-                card.depth_tier = ranked.depth_tier
                 new_cards.append(card)
-        except Exception as e:
-            print("  ERROR: {}".format(str(e)[:100]))
-            traceback.print_exc()
 
     print("\n{} new cards generated".format(len(new_cards)))
 
@@ -164,18 +158,40 @@ def run_refresh(pack=None):
 
     # Publish
     run_time = int(time.time() - start_time)
-    html = publish.run(all_cards, synth, qscan, all_reports, run_time, quality, preds_data, act_data)
+    output_dir = Path("output")
+    output_dir.mkdir(exist_ok=True)
+    index_path = output_dir / "index.html"
+    publish.write(index_path, all_cards, synth, qscan, all_reports, run_time, quality, preds_data, act_data,
+                  available_llms=available)
 
     # Save to card store
     card_store.save_run(all_cards, run_time, mode="refresh")
 
-    output_dir = Path("output")
-    output_dir.mkdir(exist_ok=True)
-    (output_dir / "index.html").write_text(html, encoding="utf-8")
     print("\nRefresh complete: output/index.html ({} cards, {}s)".format(
         len(all_cards), run_time))
 
-    return html
+    return index_path
+
+
+def _process_story(ranked, story_num, total):
+    """Process one new story at standard tier or below. Returns (card, reports)."""
+    try:
+        # Force standard tier max in refresh (no deep investigation)
+        if ranked.depth_tier == "deep":
+            ranked.depth_tier = "standard"
+
+        if ranked.depth_tier == "standard":
+            card, story_reports = _process_standard_quick(ranked, story_num, total)
+        else:
+            card, story_reports = _process_brief(ranked, story_num, total)
+
+        if card:
+            card.depth_tier = ranked.depth_tier
+        return card, story_reports
+    except Exception as e:
+        print("  ERROR: {}".format(str(e)[:100]))
+        traceback.print_exc()
+        return None, []
 
 
 def _process_standard_quick(ranked_story, story_num, total):
@@ -240,7 +256,7 @@ def _reconstruct_cards(card_dicts):
     return cards
 
 
-def _republish(topic_cards, reports, run_time):
+def _republish(topic_cards, reports, run_time, available_llms=None):
     """Republish existing cards with updated timestamp."""
     synth, synth_report = synthesize.run(topic_cards)
     reports.append(synth_report)
@@ -256,10 +272,10 @@ def _republish(topic_cards, reports, run_time):
 
     preds_data, _ = predictions.run(topic_cards)
 
-    html = publish.run(topic_cards, synth, qscan, reports, run_time, quality, preds_data, act_data)
-
     output_dir = Path("output")
     output_dir.mkdir(exist_ok=True)
-    (output_dir / "index.html").write_text(html, encoding="utf-8")
+    index_path = output_dir / "index.html"
+    publish.write(index_path, topic_cards, synth, qscan, reports, run_time, quality, preds_data, act_data,
+                  available_llms=available_llms)
 
-    return html
+    return index_path
@@ -16,6 +16,7 @@ import json
 import sys
 import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -28,6 +29,9 @@ from pipeline import (fetch, syndication, triage, cluster, arc_merge, select,
                       card_dedup, predictions, qa_review, action_layer,
                       editorial)
 
+# Stories are independent and network-bound, so several run at once
+STORY_WORKERS = 4
+
 
 def process_brief(ranked_story, story_num, total):
     """BRIEF tier: minimal processing, summary from cluster data."""
@@ -148,6 +152,20 @@ def process_deep(ranked_story, story_num, total):
     return card, reports
 
 
+def process_story(ranked_story, story_num, total):
+    """Dispatch a story to its depth tier. Returns (card, reports)."""
+    try:
+        if ranked_story.depth_tier == "deep":
+            return process_deep(ranked_story, story_num, total)
+        if ranked_story.depth_tier == "standard":
+            return process_standard(ranked_story, story_num, total)
+        return process_brief(ranked_story, story_num, total)
+    except Exception as e:
+        print("  ERROR: {}".format(str(e)[:100]))
+        traceback.print_exc()
+        return None, []
+
+
 def main():
     parser = argparse.ArgumentParser(description="Global Intelligence Briefing v3")
     parser.add_argument("--config", help="Path to query pack JSON", default=None)
@@ -227,23 +245,17 @@ def main():
     print("\nStory tiers: {} deep, {} standard, {} brief".format(
         tier_counts["deep"], tier_counts["standard"], tier_counts["brief"]))
 
-    # Process each story by tier
+    # Process each story by tier (concurrently; results keep ranking order)
     topic_cards = []
-    for i, ranked in enumerate(ranked_stories):
-        try:
-            if ranked.depth_tier == "deep":
-                card, story_reports = process_deep(ranked, i + 1, len(ranked_stories))
-            elif ranked.depth_tier == "standard":
-                card, story_reports = process_standard(ranked, i + 1, len(ranked_stories))
-            else:
-                card, story_reports = process_brief(ranked, i + 1, len(ranked_stories))
-
+    total = len(ranked_stories)
+    with ThreadPoolExecutor(max_workers=STORY_WORKERS) as pool:
+        futures = [pool.submit(process_story, ranked, i + 1, total)
+                   for i, ranked in enumerate(ranked_stories)]
+        for f in futures:
+            card, story_reports = f.result()
             all_reports.extend(story_reports)
             if card:
                 topic_cards.append(card)
-        except Exception as e:
-            print("  ERROR: {}".format(str(e)[:100]))
-            traceback.print_exc()
 
     if not topic_cards:
         print("\nNo topic cards generated")
@@ -288,22 +300,24 @@ def main():
 
     # Publish
     run_time = int(time.time() - start_time)
-    html = publish.run(topic_cards, synth, qscan, all_reports, run_time, quality, preds_data, action_data)
-
     output_dir = Path("output")
     output_dir.mkdir(exist_ok=True)
-    (output_dir / "index.html").write_text(html, encoding="utf-8")
+    publish.write(output_dir / "index.html", topic_cards, synth, qscan, all_reports,
+                  run_time, quality, preds_data, action_data, available_llms=available)
     print("\nBriefing: output/index.html")
 
+    # Serialize cards once for both the card store and the flat cache
+    card_dicts = [card.to_dict() for card in topic_cards]
+
     # Save to card store for cross-run state
-    card_store.save_run(topic_cards, run_time, mode="full")
+    card_store.save_run(topic_cards, run_time, mode="full", card_dicts=card_dicts)
 
     # Also save flat cache for backward compat
     cache = {
         "date": datetime.now(timezone.utc).isoformat(),
         "runtime_seconds": run_time,
         "tier_counts": tier_counts,
-        "cards": [card.to_dict() for card in topic_cards],
+        "cards": card_dicts,
     }
     (output_dir / "briefing_data.json").write_text(
         json.dumps(cache, indent=2, default=str), encoding="utf-8")